@@ -2,6 +2,7 @@
 Configuration management for Finnish NLP Toolkit
 """
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 
@@ -13,6 +14,10 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     API_RELOAD: bool = False
+    THREADPOOL_SIZE: int = 100  # Concurrent sync handlers (anyio default is 40)
+    BATCH_EXECUTOR: str = "thread"  # "thread" or "process" (for GIL-bound engines)
+    BATCH_WORKERS: int = 0  # Batch pool size, 0 = os.cpu_count()
+    BATCH_CONCURRENCY: int = 0  # Batch requests processed at once, 0 = os.cpu_count()
 
     # Feature flags for advanced NLP
     USE_VOIKKO: bool = False
@@ -24,10 +29,19 @@ class Settings(BaseSettings):
     # Model paths
     UDPIPE_MODEL_PATH: str = "data/models/finnish-tdt-ud-2.5-191206.udpipe"
     TOXICITY_MODEL_PATH: Optional[str] = None
+    SPACY_BATCH_SIZE: int = 32  # Documents per nlp.pipe batch
+    UDPIPE_THREADS: int = 0  # Parallel UDPipe parses per batch, 0 = os.cpu_count()
+
+    # Per-router in-process cache of NLP results (entries, 0 disables)
+    RESULT_CACHE_SIZE: int = 1024
+
+    # Per-word lemma cache in the lemmatizers (entries)
+    WORD_CACHE_SIZE: int = 50000
 
     # Redis configuration
     REDIS_URL: str = "redis://localhost:6379/0"
     CACHE_TTL: int = 3600
+    REDIS_MAX_CONNECTIONS: int = 64  # Connection pool size per process
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -38,10 +52,17 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra fields in .env
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings
 
+    Parsed from the environment/.env once and cached. Also usable as a FastAPI
+    dependency (Depends(get_settings)), which tests can override through
+    app.dependency_overrides.
+    """
+    return Settings()
 
-def get_settings() -> Settings:
-    """Get application settings"""
-    return settings
+
+# Global settings instance
+settings = get_settings()
@@ -0,0 +1,150 @@
+"""
+Shared NLP engines
+Builds one instance of each engine for the whole application
+
+Engine modules are imported inside the loaders, so a worker only pays for
+the engines it actually uses. Engines are built on first use (or by the
+background warm-up started from the lifespan) and stored on app.state.
+"""
+from fastapi import FastAPI, HTTPException, Request
+from app.config import get_settings
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def load_lemmatizer():
+    """
+    Build the lemmatizer engine (advanced if configured, basic otherwise)
+
+    Called once per application, on first use.
+    """
+    settings = get_settings()
+    try:
+        if settings.USE_VOIKKO:
+            from app.services.advanced_lemma_engine import AdvancedLemmatizerEngine
+            lemmatizer = AdvancedLemmatizerEngine(use_voikko=True, word_cache_size=settings.WORD_CACHE_SIZE)
+            logger.info("Using Advanced Lemmatizer with Voikko")
+        else:
+            from app.services.lemma_engine import LemmatizerEngine
+            lemmatizer = LemmatizerEngine(word_cache_size=settings.WORD_CACHE_SIZE)
+            logger.info("Using Basic Lemmatizer")
+    except Exception as e:
+        logger.error(f"Failed to initialize lemmatizer: {e}", exc_info=True)
+        # Fallback to basic
+        from app.services.lemma_engine import LemmatizerEngine
+        lemmatizer = LemmatizerEngine()
+        logger.warning("Fallback to Basic Lemmatizer")
+    return lemmatizer
+
+
+def load_complexity_analyzer():
+    """
+    Build the complexity engine (advanced if configured, basic otherwise)
+
+    Called once per application, on first use.
+    """
+    settings = get_settings()
+    try:
+        if settings.USE_UDPIPE or settings.USE_SPACY:
+            from app.services.advanced_complexity_engine import AdvancedComplexityEngine
+            complexity_analyzer = AdvancedComplexityEngine(
+                use_udpipe=settings.USE_UDPIPE,
+                use_spacy=settings.USE_SPACY,
+                spacy_batch_size=settings.SPACY_BATCH_SIZE,
+                udpipe_threads=settings.UDPIPE_THREADS
+            )
+            logger.info(f"Using Advanced Complexity Analyzer (UDPipe: {settings.USE_UDPIPE}, spaCy: {settings.USE_SPACY})")
+        else:
+            from app.services.complexity_engine import ComplexityEngine
+            complexity_analyzer = ComplexityEngine()
+            logger.info("Using Basic Complexity Analyzer")
+    except Exception as e:
+        logger.error(f"Failed to initialize complexity analyzer: {e}", exc_info=True)
+        # Fallback to basic
+        from app.services.complexity_engine import ComplexityEngine
+        complexity_analyzer = ComplexityEngine()
+        logger.warning("Fallback to Basic Complexity Analyzer")
+    return complexity_analyzer
+
+
+def load_profanity_detector():
+    """
+    Build the profanity detector (advanced if configured, basic otherwise)
+
+    Called once per application, on first use.
+    """
+    settings = get_settings()
+    try:
+        if settings.USE_TRANSFORMERS:
+            from app.services.advanced_profanity_model import AdvancedProfanityDetector
+            profanity_detector = AdvancedProfanityDetector(use_transformers=True)
+            logger.info("Using Advanced Profanity Detector with Transformers")
+        else:
+            from app.services.profanity_model import ProfanityDetector
+            profanity_detector = ProfanityDetector()
+            logger.info("Using Basic Profanity Detector")
+    except Exception as e:
+        logger.error(f"Failed to initialize profanity detector: {e}", exc_info=True)
+        # Fallback to basic
+        from app.services.profanity_model import ProfanityDetector
+        profanity_detector = ProfanityDetector()
+        logger.warning("Fallback to Basic Profanity Detector")
+    return profanity_detector
+
+
+ENGINE_LOADERS = {
+    "lemmatizer": load_lemmatizer,
+    "complexity_analyzer": load_complexity_analyzer,
+    "profanity_detector": load_profanity_detector,
+}
+
+
+async def ensure_engine(app: FastAPI, name: str):
+    """
+    Return the named engine, building it off the event loop if needed
+
+    Concurrent first requests share a single build through a per-engine lock.
+    """
+    engine = getattr(app.state, name, None)
+    if engine is not None:
+        return engine
+
+    if getattr(app.state, "engine_locks", None) is None:
+        app.state.engine_locks = {}
+    async with app.state.engine_locks.setdefault(name, asyncio.Lock()):
+        engine = getattr(app.state, name, None)
+        if engine is None:
+            engine = await asyncio.to_thread(ENGINE_LOADERS[name])
+            setattr(app.state, name, engine)
+    return engine
+
+
+async def warm_up(app: FastAPI):
+    """Build all engines concurrently so the first requests do not pay for it"""
+    await asyncio.gather(*(ensure_engine(app, name) for name in ENGINE_LOADERS))
+    logger.info("NLP engines loaded")
+
+
+async def _get_engine(request: Request, name: str, service: str):
+    try:
+        return await ensure_engine(request.app, name)
+    except Exception as e:
+        logger.error(f"Failed to load {name}: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail=f"{service} service not available")
+
+
+async def get_lemmatizer(request: Request):
+    """Dependency returning the shared lemmatizer"""
+    return await _get_engine(request, "lemmatizer", "Lemmatizer")
+
+
+async def get_complexity_analyzer(request: Request):
+    """Dependency returning the shared complexity analyzer"""
+    return await _get_engine(request, "complexity_analyzer", "Complexity analyzer")
+
+
+async def get_profanity_detector(request: Request):
+    """Dependency returning the shared profanity detector"""
+    return await _get_engine(request, "profanity_detector", "Profanity detector")
@@ -4,29 +4,93 @@ Main FastAPI application entry point
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
+from contextlib import asynccontextmanager
+from app.config import get_settings
+from app import engines
+from app.utils.etag import ETagMiddleware
+import anyio
+import asyncio
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict
+import queue
 import sys
 
-# Configure logging
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted
+
+    The stock prepare() formats the message and traceback in the calling
+    thread; here the listener's handler does both, off the request path.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Configure logging: request threads only enqueue records, a listener thread
+# (started in the lifespan) formats them and writes to stdout
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _stream_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout)
+        _DeferredQueueHandler(_log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
 
+async def _warm_up(app: FastAPI):
+    """Build engines in the background, then start workers that depend on them"""
+    try:
+        await engines.warm_up(app)
+        app.state.profanity_batcher = profanity.build_profanity_batcher(app.state.profanity_detector)
+        if app.state.profanity_batcher is not None:
+            app.state.profanity_batcher.start()
+    except Exception as e:
+        logger.error(f"Engine warm-up failed, engines will load on first use: {e}", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up NLP engines and background workers on startup, stop them on shutdown
+
+    Warm-up runs as a background task so the server (and /health) is up
+    immediately; requests that arrive first load their engine on demand.
+    """
+    # Records logged before startup wait in the queue until the listener runs
+    _log_listener.start()
+
+    # Sync endpoints run NLP work in anyio's threadpool; size it for CPU-bound handlers
+    anyio.to_thread.current_default_thread_limiter().total_tokens = get_settings().THREADPOOL_SIZE
+
+    app.state.engine_locks = {}
+    app.state.profanity_batcher = None
+    warm_up_task = asyncio.create_task(_warm_up(app))
+    yield
+    warm_up_task.cancel()
+    if app.state.profanity_batcher is not None:
+        await app.state.profanity_batcher.stop()
+    batch_processing.shutdown_batch_executors()
+    _log_listener.stop()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Finnish NLP Toolkit API",
     description="Backend service for Finnish text lemmatization, complexity analysis, and profanity detection",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -38,10 +102,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Conditional GET: ETag on API responses, 304 when the client's copy is current
+app.add_middleware(ETagMiddleware)
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    logger.error(f"Global exception: {str(exc)}", exc_info=True)
+    logger.exception(f"Global exception: {str(exc)}")
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "error": str(exc)}
@@ -93,10 +160,15 @@ app.include_router(batch_processing.router, prefix="/api", tags=["Batch Processi
 
 if __name__ == "__main__":
     import uvicorn
+    settings = get_settings()
+    # loop/http "auto" picks uvloop and httptools (installed by uvicorn[standard])
+    # and falls back to asyncio/h11 where they are unavailable, e.g. on Windows
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
+        host=settings.API_HOST,
+        port=settings.API_PORT,
+        reload=settings.API_RELOAD,
+        loop="auto",
+        http="auto",
+        log_level=settings.LOG_LEVEL.lower()
     )
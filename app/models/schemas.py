@@ -1,8 +1,13 @@
 """
 Pydantic models for request/response validation
+
+Request models validate untrusted input. Response models are built by the
+engines with model_construct (no validation), so engines must pass values of
+the declared types.
 """
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
+import sys
 
 
 # Lemmatization Models
@@ -61,6 +66,12 @@ class CaseDistribution(BaseModel):
     other: int = 0
 
 
+# Case field names in CaseDistribution order, and their positions, for engines
+# that count into a flat array and box the model once
+CASE_NAMES = tuple(CaseDistribution.model_fields)
+CASE_INDEX = {sys.intern(name): index for index, name in enumerate(CASE_NAMES)}
+
+
 class ComplexityResponse(BaseModel):
     text: str = Field(..., description="Original input text")
     sentence_count: int = Field(..., description="Number of sentences")
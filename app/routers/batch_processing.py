@@ -2,25 +2,255 @@
 Batch Processing Router
 Handle multiple texts in a single request
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from app.models.schemas import LemmatizationResponse, ComplexityResponse, ProfanityResponse
-from app.services.lemma_engine import LemmatizerEngine
-from app.services.complexity_engine import ComplexityEngine
-from app.services.profanity_model import ProfanityDetector
+from app.utils.responses import ModelResponse
+from app.config import Settings, get_settings
+from app.engines import (
+    get_lemmatizer, get_complexity_analyzer, get_profanity_detector,
+    load_lemmatizer, load_complexity_analyzer, load_profanity_detector
+)
+import asyncio
+import functools
 import logging
+import multiprocessing
+import orjson
+import os
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Initialize engines
-try:
-    lemmatizer = LemmatizerEngine()
-    complexity_analyzer = ComplexityEngine()
-    profanity_detector = ProfanityDetector()
-except Exception as e:
-    logger.error(f"Failed to initialize engines: {e}")
+settings = get_settings()
+_WORKERS = settings.BATCH_WORKERS or os.cpu_count()
+
+# Shared pool so batch items run off the event loop and overlap with each other
+_EXECUTOR = ThreadPoolExecutor(max_workers=_WORKERS)
+
+# Bounds how many batches are in flight at once, so bursts of large batches
+# queue up instead of multiplying peak memory
+_BATCH_SLOTS = asyncio.Semaphore(settings.BATCH_CONCURRENCY or os.cpu_count())
+
+# Optional process pool for pure-Python engines that hold the GIL (BATCH_EXECUTOR=process)
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Engines owned by a process-pool worker, keyed by the engine method they serve
+_worker_engines: Dict[str, object] = {}
+
+
+def _init_worker():
+    """Process-pool initializer: load each engine once per worker"""
+    _worker_engines.update(
+        lemmatize=load_lemmatizer(),
+        analyze=load_complexity_analyzer(),
+        detect=load_profanity_detector()
+    )
+
+
+def _call_in_worker(method: str, text: str, **kwargs):
+    """Run one batch item against the worker's own engine"""
+    return getattr(_worker_engines[method], method)(text=text, **kwargs)
+
+
+def _get_process_pool(settings: Settings) -> ProcessPoolExecutor:
+    """
+    Create the process pool on first use (spawned, so no threads are forked)
+
+    Sized from the settings of the request that starts it; the pool is then
+    kept until shutdown_batch_executors().
+    """
+    global _process_pool
+    if _process_pool is None:
+        workers = settings.BATCH_WORKERS or os.cpu_count()
+        logger.info(f"Starting batch process pool with {workers} workers")
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+    return _process_pool
+
+
+def shutdown_batch_executors():
+    """Shut down the batch process pool, if one was started"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(cancel_futures=True)
+        _process_pool = None
+
+
+def _dispatch(engine, method: str, texts: List[str], settings: Settings, **kwargs) -> list:
+    """
+    Submit engine.<method> for each text to the configured executor
+
+    In process mode the workers use their own engines and the parent's
+    engine is unused; the parent builds it anyway at warm-up, as the
+    single-text endpoints need it.
+
+    Returns one asyncio future per text.
+    """
+    if settings.BATCH_EXECUTOR == "process":
+        executor = _get_process_pool(settings)
+        func = functools.partial(_call_in_worker, method)
+    else:
+        executor = _EXECUTOR
+        func = getattr(engine, method)
+
+    loop = asyncio.get_running_loop()
+    return [
+        loop.run_in_executor(executor, functools.partial(func, text=text, **kwargs))
+        for text in texts
+    ]
+
+
+async def _run_batch(engine, method: str, texts: List[str], settings: Settings, **kwargs) -> list:
+    """
+    Run engine.<method> once per distinct text on the configured executor
+
+    Engines that provide <method>_batch get all distinct texts in one call.
+    Duplicate texts are computed once and fanned back out, so results
+    keep the input order and length.
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    batch_method = getattr(engine, f"{method}_batch", None)
+    async with _BATCH_SLOTS:
+        if batch_method is not None and settings.BATCH_EXECUTOR != "process":
+            # Engine has a native batch API (spaCy nlp.pipe, one model forward pass)
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                _EXECUTOR, functools.partial(batch_method, unique_texts, **kwargs)
+            )
+        else:
+            futures = _dispatch(engine, method, unique_texts, settings, **kwargs)
+            results = await asyncio.gather(*futures)
+        results_by_text = dict(zip(unique_texts, results))
+    return [results_by_text[text] for text in texts]
+
+
+def _release_slot_when_done(futures: list):
+    """Release one _BATCH_SLOTS slot once all futures are done (or cancelled)"""
+    if not futures:
+        _BATCH_SLOTS.release()
+        return
+    remaining = len(futures)
+
+    def on_done(_):
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            _BATCH_SLOTS.release()
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+
+def _stream_batch(
+    engine,
+    method: str,
+    texts: List[str],
+    accumulate: Callable[[dict, Any], None],
+    summarize: Callable[[dict, int], dict],
+    settings: Settings,
+    **kwargs
+) -> StreamingResponse:
+    """
+    Stream batch results as NDJSON in completion order
+
+    Each line is {"index": i, "result": {...}} (or {"index": i, "error": "..."}),
+    followed by a final {"summary": {...}} line. The summary covers the
+    successful texts only and reports failed ones as "failed". Results are
+    written as soon as they finish and are not kept, so memory stays flat for
+    large batches.
+    """
+    positions = defaultdict(list)
+    for index, text in enumerate(texts):
+        positions[text].append(index)
+
+    async def generate():
+        totals: Dict[str, float] = {}
+        failed = 0
+        # The slot bounds work in flight, not how long the client takes to
+        # read, so it is released once every item has finished computing
+        await _BATCH_SLOTS.acquire()
+        try:
+            dispatched = _dispatch(engine, method, list(positions), settings, **kwargs)
+        except BaseException:
+            _BATCH_SLOTS.release()
+            raise
+        _release_slot_when_done(dispatched)
+
+        futures = dict(zip(dispatched, positions))
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    indices = positions[futures[future]]
+                    # Cancelled items (executor shut down) are failures, not a
+                    # CancelledError that would end the stream without a summary
+                    if future.cancelled():
+                        error = "cancelled"
+                    elif future.exception() is not None:
+                        error = str(future.exception())
+                    else:
+                        error = None
+                    if error is not None:
+                        logger.error(f"Batch stream item failed: {error}")
+                        failed += len(indices)
+                        for index in indices:
+                            yield orjson.dumps({"index": index, "error": error}) + b"\n"
+                        continue
+
+                    result = future.result()
+                    payload = result.model_dump_json().encode("utf-8")
+                    for index in indices:
+                        accumulate(totals, result)
+                        yield b'{"index":%d,"result":%s}\n' % (index, payload)
+        finally:
+            # Client gone (or stream cancelled): drop items not started yet
+            for future in pending:
+                future.cancel()
+        summary = summarize(totals, len(texts) - failed)
+        summary["failed"] = failed
+        yield orjson.dumps({"summary": summary}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _accumulate_lemmas(totals: dict, result: LemmatizationResponse):
+    totals["total_words"] = totals.get("total_words", 0) + result.word_count
+
+
+def _summarize_lemmas(totals: dict, count: int) -> dict:
+    return {"total_texts": count, "total_words": totals.get("total_words", 0)}
+
+
+def _accumulate_complexity(totals: dict, result: ComplexityResponse):
+    totals["score"] = totals.get("score", 0.0) + result.morphological_depth_score
+
+
+def _summarize_complexity(totals: dict, count: int) -> dict:
+    return {
+        "total_texts": count,
+        "average_complexity_score": round(totals.get("score", 0.0) / count, 2) if count else 0.0
+    }
+
+
+def _accumulate_profanity(totals: dict, result: ProfanityResponse):
+    totals["toxic_count"] = totals.get("toxic_count", 0) + int(result.is_toxic)
+    totals["score"] = totals.get("score", 0.0) + result.toxicity_score
+
+
+def _summarize_profanity(totals: dict, count: int) -> dict:
+    return {
+        "total_texts": count,
+        "toxic_count": totals.get("toxic_count", 0),
+        "average_toxicity_score": round(totals.get("score", 0.0) / count, 3) if count else 0.0
+    }
 
 
 # Batch request models
@@ -61,7 +291,11 @@ class BatchProfanityResponse(BaseModel):
 
 
 @router.post("/batch/lemmatize", response_model=BatchLemmatizeResponse)
-async def batch_lemmatize(request: BatchLemmatizeRequest):
+async def batch_lemmatize(
+    request: BatchLemmatizeRequest,
+    lemmatizer=Depends(get_lemmatizer),
+    settings: Settings = Depends(get_settings)
+):
     """
     Batch lemmatization of multiple texts
 
@@ -74,22 +308,20 @@ async def batch_lemmatize(request: BatchLemmatizeRequest):
     - Total statistics
     """
     try:
-        results = []
-        total_words = 0
-
-        for text in request.texts:
-            result = lemmatizer.lemmatize(
-                text=text,
-                include_morphology=request.include_morphology
-            )
-            results.append(result)
-            total_words += result.word_count
+        results = await _run_batch(
+            lemmatizer,
+            "lemmatize",
+            request.texts,
+            settings=settings,
+            include_morphology=request.include_morphology
+        )
+        total_words = sum(result.word_count for result in results)
 
-        return BatchLemmatizeResponse(
+        return ModelResponse(BatchLemmatizeResponse.model_construct(
             results=results,
             total_texts=len(results),
             total_words=total_words
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Batch lemmatization error: {e}", exc_info=True)
@@ -97,7 +329,11 @@ async def batch_lemmatize(request: BatchLemmatizeRequest):
 
 
 @router.post("/batch/complexity", response_model=BatchComplexityResponse)
-async def batch_complexity(request: BatchComplexityRequest):
+async def batch_complexity(
+    request: BatchComplexityRequest,
+    complexity_analyzer=Depends(get_complexity_analyzer),
+    settings: Settings = Depends(get_settings)
+):
     """
     Batch complexity analysis of multiple texts
 
@@ -110,24 +346,21 @@ async def batch_complexity(request: BatchComplexityRequest):
     - Average complexity score
     """
     try:
-        results = []
-        total_score = 0.0
-
-        for text in request.texts:
-            result = complexity_analyzer.analyze(
-                text=text,
-                detailed=request.detailed
-            )
-            results.append(result)
-            total_score += result.morphological_depth_score
-
+        results = await _run_batch(
+            complexity_analyzer,
+            "analyze",
+            request.texts,
+            settings=settings,
+            detailed=request.detailed
+        )
+        total_score = sum(result.morphological_depth_score for result in results)
         avg_score = total_score / len(results) if results else 0.0
 
-        return BatchComplexityResponse(
+        return ModelResponse(BatchComplexityResponse.model_construct(
             results=results,
             total_texts=len(results),
             average_complexity_score=round(avg_score, 2)
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Batch complexity error: {e}", exc_info=True)
@@ -135,7 +368,11 @@ async def batch_complexity(request: BatchComplexityRequest):
 
 
 @router.post("/batch/swear-check", response_model=BatchProfanityResponse)
-async def batch_profanity(request: BatchProfanityRequest):
+async def batch_profanity(
+    request: BatchProfanityRequest,
+    profanity_detector=Depends(get_profanity_detector),
+    settings: Settings = Depends(get_settings)
+):
     """
     Batch profanity detection for multiple texts
 
@@ -150,31 +387,98 @@ async def batch_profanity(request: BatchProfanityRequest):
     - Average toxicity score
     """
     try:
-        results = []
-        toxic_count = 0
-        total_score = 0.0
-
-        for text in request.texts:
-            result = profanity_detector.detect(
-                text=text,
-                return_flagged_words=request.return_flagged_words,
-                threshold=request.threshold
-            )
-            results.append(result)
-
-            if result.is_toxic:
-                toxic_count += 1
-            total_score += result.toxicity_score
-
+        results = await _run_batch(
+            profanity_detector,
+            "detect",
+            request.texts,
+            settings=settings,
+            return_flagged_words=request.return_flagged_words,
+            threshold=request.threshold
+        )
+        toxic_count = sum(1 for result in results if result.is_toxic)
+        total_score = sum(result.toxicity_score for result in results)
         avg_score = total_score / len(results) if results else 0.0
 
-        return BatchProfanityResponse(
+        return ModelResponse(BatchProfanityResponse.model_construct(
             results=results,
             total_texts=len(results),
             toxic_count=toxic_count,
             average_toxicity_score=round(avg_score, 3)
-        )
+        ))
 
     except Exception as e:
         logger.error(f"Batch profanity detection error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Batch profanity detection failed: {str(e)}")
+
+
+@router.post("/batch/lemmatize/stream")
+async def batch_lemmatize_stream(
+    request: BatchLemmatizeRequest,
+    lemmatizer=Depends(get_lemmatizer),
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Batch lemmatization streamed as NDJSON
+
+    **Output:**
+    - One line per text as it completes: {"index": ..., "result": {...}}
+    - Final line: {"summary": {"total_texts": ..., "total_words": ..., "failed": ...}}
+    """
+    return _stream_batch(
+        lemmatizer,
+        "lemmatize",
+        request.texts,
+        _accumulate_lemmas,
+        _summarize_lemmas,
+        settings=settings,
+        include_morphology=request.include_morphology
+    )
+
+
+@router.post("/batch/complexity/stream")
+async def batch_complexity_stream(
+    request: BatchComplexityRequest,
+    complexity_analyzer=Depends(get_complexity_analyzer),
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Batch complexity analysis streamed as NDJSON
+
+    **Output:**
+    - One line per text as it completes: {"index": ..., "result": {...}}
+    - Final line: {"summary": {"total_texts": ..., "average_complexity_score": ..., "failed": ...}}
+    """
+    return _stream_batch(
+        complexity_analyzer,
+        "analyze",
+        request.texts,
+        _accumulate_complexity,
+        _summarize_complexity,
+        settings=settings,
+        detailed=request.detailed
+    )
+
+
+@router.post("/batch/swear-check/stream")
+async def batch_profanity_stream(
+    request: BatchProfanityRequest,
+    profanity_detector=Depends(get_profanity_detector),
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Batch profanity detection streamed as NDJSON
+
+    **Output:**
+    - One line per text as it completes: {"index": ..., "result": {...}}
+    - Final line: {"summary": {"total_texts": ..., "toxic_count": ..., "average_toxicity_score": ..., "failed": ...}}
+    """
+    return _stream_batch(
+        profanity_detector,
+        "detect",
+        request.texts,
+        _accumulate_profanity,
+        _summarize_profanity,
+        settings=settings,
+        return_flagged_words=request.return_flagged_words,
+        threshold=request.threshold
+    )
@@ -2,38 +2,27 @@
 Complexity Analysis Router
 Handles sentence complexity analysis endpoints
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.models.schemas import ComplexityRequest, ComplexityResponse
 from app.config import get_settings
+from app.engines import get_complexity_analyzer
+from app.utils.responses import ModelResponse
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
 
-# Initialize complexity engine (advanced if configured, basic otherwise)
-try:
-    if settings.USE_UDPIPE or settings.USE_SPACY:
-        from app.services.advanced_complexity_engine import AdvancedComplexityEngine
-        complexity_analyzer = AdvancedComplexityEngine(
-            use_udpipe=settings.USE_UDPIPE,
-            use_spacy=settings.USE_SPACY
-        )
-        logger.info(f"Using Advanced Complexity Analyzer (UDPipe: {settings.USE_UDPIPE}, spaCy: {settings.USE_SPACY})")
-    else:
-        from app.services.complexity_engine import ComplexityEngine
-        complexity_analyzer = ComplexityEngine()
-        logger.info("Using Basic Complexity Analyzer")
-except Exception as e:
-    logger.error(f"Failed to initialize complexity analyzer: {e}")
-    # Fallback to basic
-    from app.services.complexity_engine import ComplexityEngine
-    complexity_analyzer = ComplexityEngine()
-    logger.warning("Fallback to Basic Complexity Analyzer")
+
+@lru_cache(maxsize=settings.RESULT_CACHE_SIZE)
+def _cached_analyze(complexity_analyzer, text: str, detailed: bool) -> ComplexityResponse:
+    """Analyze text, reusing the result for repeated (engine, text, options) tuples"""
+    return complexity_analyzer.analyze(text=text, detailed=detailed)
 
 
 @router.post("/complexity", response_model=ComplexityResponse)
-async def analyze_complexity(request: ComplexityRequest):
+def analyze_complexity(request: ComplexityRequest, complexity_analyzer=Depends(get_complexity_analyzer)):
     """
     Analyze Finnish text complexity
 
@@ -49,24 +38,19 @@ async def analyze_complexity(request: ComplexityRequest):
     - Case distribution
     - Complexity rating
     """
-    if complexity_analyzer is None:
-        raise HTTPException(status_code=503, detail="Complexity analyzer service not available")
-
     try:
-        result = complexity_analyzer.analyze(
-            text=request.text,
-            detailed=request.detailed
-        )
-        return result
+        result = _cached_analyze(complexity_analyzer, request.text, request.detailed)
+        return ModelResponse(result)
     except Exception as e:
         logger.error(f"Complexity analysis error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Complexity analysis failed: {str(e)}")
 
 
 @router.get("/complexity", response_model=ComplexityResponse)
-async def analyze_complexity_get(
+def analyze_complexity_get(
     text: str = Query(..., description="Finnish text to analyze", min_length=1, max_length=10000),
-    detailed: bool = Query(True, description="Include detailed analysis")
+    detailed: bool = Query(True, description="Include detailed analysis"),
+    complexity_analyzer=Depends(get_complexity_analyzer)
 ):
     """
     Analyze Finnish text complexity (GET method)
@@ -78,5 +62,6 @@ async def analyze_complexity_get(
     **Returns:**
     - Complexity analysis results
     """
-    request = ComplexityRequest(text=text, detailed=detailed)
-    return await analyze_complexity(request)
+    # Query() already enforced the same constraints as ComplexityRequest
+    request = ComplexityRequest.model_construct(text=text, detailed=detailed)
+    return analyze_complexity(request, complexity_analyzer)
@@ -2,35 +2,27 @@
 Lemmatization Router
 Handles Finnish text lemmatization endpoints
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.models.schemas import LemmatizationRequest, LemmatizationResponse
 from app.config import get_settings
+from app.engines import get_lemmatizer
+from app.utils.responses import ModelResponse
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
 
-# Initialize lemmatizer engine (advanced if configured, basic otherwise)
-try:
-    if settings.USE_VOIKKO:
-        from app.services.advanced_lemma_engine import AdvancedLemmatizerEngine
-        lemmatizer = AdvancedLemmatizerEngine(use_voikko=True)
-        logger.info("Using Advanced Lemmatizer with Voikko")
-    else:
-        from app.services.lemma_engine import LemmatizerEngine
-        lemmatizer = LemmatizerEngine()
-        logger.info("Using Basic Lemmatizer")
-except Exception as e:
-    logger.error(f"Failed to initialize lemmatizer: {e}")
-    # Fallback to basic
-    from app.services.lemma_engine import LemmatizerEngine
-    lemmatizer = LemmatizerEngine()
-    logger.warning("Fallback to Basic Lemmatizer")
+
+@lru_cache(maxsize=settings.RESULT_CACHE_SIZE)
+def _cached_lemmatize(lemmatizer, text: str, include_morphology: bool) -> LemmatizationResponse:
+    """Lemmatize text, reusing the result for repeated (engine, text, options) tuples"""
+    return lemmatizer.lemmatize(text=text, include_morphology=include_morphology)
 
 
 @router.post("/lemmatize", response_model=LemmatizationResponse)
-async def lemmatize_text(request: LemmatizationRequest):
+def lemmatize_text(request: LemmatizationRequest, lemmatizer=Depends(get_lemmatizer)):
     """
     Lemmatize Finnish text
 
@@ -43,24 +35,19 @@ async def lemmatize_text(request: LemmatizationRequest):
     - List of lemmatized words with morphological information
     - Word count
     """
-    if lemmatizer is None:
-        raise HTTPException(status_code=503, detail="Lemmatizer service not available")
-
     try:
-        result = lemmatizer.lemmatize(
-            text=request.text,
-            include_morphology=request.include_morphology
-        )
-        return result
+        result = _cached_lemmatize(lemmatizer, request.text, request.include_morphology)
+        return ModelResponse(result)
     except Exception as e:
         logger.error(f"Lemmatization error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Lemmatization failed: {str(e)}")
 
 
 @router.get("/lemmatize", response_model=LemmatizationResponse)
-async def lemmatize_text_get(
+def lemmatize_text_get(
     text: str = Query(..., description="Finnish text to lemmatize", min_length=1, max_length=10000),
-    include_morphology: bool = Query(True, description="Include morphological information")
+    include_morphology: bool = Query(True, description="Include morphological information"),
+    lemmatizer=Depends(get_lemmatizer)
 ):
     """
     Lemmatize Finnish text (GET method for simple queries)
@@ -72,5 +59,6 @@ async def lemmatize_text_get(
     **Returns:**
     - Lemmatization results
     """
-    request = LemmatizationRequest(text=text, include_morphology=include_morphology)
-    return await lemmatize_text(request)
+    # Query() already enforced the same constraints as LemmatizationRequest
+    request = LemmatizationRequest.model_construct(text=text, include_morphology=include_morphology)
+    return lemmatize_text(request, lemmatizer)
@@ -2,35 +2,85 @@
 Profanity Detection Router
 Handles profanity/toxicity detection endpoints
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from app.models.schemas import ProfanityRequest, ProfanityResponse
 from app.config import get_settings
+from app.engines import get_profanity_detector
+from app.utils.batching import MicroBatcher
+from app.utils.responses import ModelResponse
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
 
-# Initialize profanity detector (advanced if configured, basic otherwise)
-try:
-    if settings.USE_TRANSFORMERS:
-        from app.services.advanced_profanity_model import AdvancedProfanityDetector
-        profanity_detector = AdvancedProfanityDetector(use_transformers=True)
-        logger.info("Using Advanced Profanity Detector with Transformers")
-    else:
-        from app.services.profanity_model import ProfanityDetector
-        profanity_detector = ProfanityDetector()
-        logger.info("Using Basic Profanity Detector")
-except Exception as e:
-    logger.error(f"Failed to initialize profanity detector: {e}")
-    # Fallback to basic
-    from app.services.profanity_model import ProfanityDetector
-    profanity_detector = ProfanityDetector()
-    logger.warning("Fallback to Basic Profanity Detector")
+
+def build_profanity_batcher(profanity_detector) -> Optional[MicroBatcher]:
+    """
+    Build a micro-batcher for the detector, or None if it has nothing to share
+
+    Coalescing only pays off when there is a model forward pass to share;
+    the keyword detectors have no per-call overhead worth batching.
+    """
+    if getattr(profanity_detector, "model", None) is None:
+        return None
+    logger.info("Micro-batching enabled for profanity detection")
+    return MicroBatcher(
+        partial(_detect_coalesced, profanity_detector),
+        max_batch_size=16,
+        max_delay=0.02
+    )
+
+
+async def get_profanity_batcher(request: Request) -> Optional[MicroBatcher]:
+    """Dependency returning the running micro-batcher, if any"""
+    batcher = getattr(request.app.state, "profanity_batcher", None)
+    if batcher is not None and batcher.is_running:
+        return batcher
+    return None
+
+
+@lru_cache(maxsize=settings.RESULT_CACHE_SIZE)
+def _cached_detect(profanity_detector, text: str, return_flagged_words: bool, threshold: float) -> ProfanityResponse:
+    """Detect profanity, reusing the result for repeated (engine, text, options) tuples"""
+    return profanity_detector.detect(
+        text=text,
+        return_flagged_words=return_flagged_words,
+        threshold=threshold
+    )
+
+
+def _detect_coalesced(profanity_detector, requests: List[ProfanityRequest]) -> List[ProfanityResponse]:
+    """
+    Detect a micro-batch of requests with one detect_batch call per option set
+    """
+    results = [None] * len(requests)
+    groups = defaultdict(list)
+    for index, request in enumerate(requests):
+        groups[(request.return_flagged_words, request.threshold)].append(index)
+
+    for (return_flagged_words, threshold), indices in groups.items():
+        batch_results = profanity_detector.detect_batch(
+            [requests[i].text for i in indices],
+            return_flagged_words=return_flagged_words,
+            threshold=threshold
+        )
+        for index, result in zip(indices, batch_results):
+            results[index] = result
+
+    return results
 
 
 @router.post("/swear-check", response_model=ProfanityResponse)
-async def check_profanity(request: ProfanityRequest):
+async def check_profanity(
+    request: ProfanityRequest,
+    profanity_detector=Depends(get_profanity_detector),
+    profanity_batcher: Optional[MicroBatcher] = Depends(get_profanity_batcher)
+):
     """
     Check Finnish text for profanity/toxicity
 
@@ -45,16 +95,18 @@ async def check_profanity(request: ProfanityRequest):
     - Flagged words (if requested)
     - Severity rating
     """
-    if profanity_detector is None:
-        raise HTTPException(status_code=503, detail="Profanity detector service not available")
-
     try:
-        result = profanity_detector.detect(
-            text=request.text,
-            return_flagged_words=request.return_flagged_words,
-            threshold=request.threshold
+        if profanity_batcher is not None:
+            return ModelResponse(await profanity_batcher.submit(request))
+
+        result = await run_in_threadpool(
+            _cached_detect,
+            profanity_detector,
+            request.text,
+            request.return_flagged_words,
+            request.threshold
         )
-        return result
+        return ModelResponse(result)
     except Exception as e:
         logger.error(f"Profanity detection error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Profanity detection failed: {str(e)}")
@@ -64,7 +116,9 @@ async def check_profanity(request: ProfanityRequest):
 async def check_profanity_get(
     text: str = Query(..., description="Text to check for profanity", min_length=1, max_length=10000),
     return_flagged_words: bool = Query(False, description="Return list of flagged words"),
-    threshold: float = Query(0.5, description="Detection threshold (0-1)", ge=0.0, le=1.0)
+    threshold: float = Query(0.5, description="Detection threshold (0-1)", ge=0.0, le=1.0),
+    profanity_detector=Depends(get_profanity_detector),
+    profanity_batcher: Optional[MicroBatcher] = Depends(get_profanity_batcher)
 ):
     """
     Check Finnish text for profanity/toxicity (GET method)
@@ -77,9 +131,10 @@ async def check_profanity_get(
     **Returns:**
     - Profanity detection results
     """
-    request = ProfanityRequest(
+    # Query() already enforced the same constraints as ProfanityRequest
+    request = ProfanityRequest.model_construct(
         text=text,
         return_flagged_words=return_flagged_words,
         threshold=threshold
     )
-    return await check_profanity(request)
+    return await check_profanity(request, profanity_detector, profanity_batcher)
@@ -2,13 +2,70 @@
 Advanced Finnish Text Complexity Analysis with UDPipe & spaCy
 Real dependency parsing for accurate complexity metrics
 """
+import os
 import re
+import sys
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from array import array
 from typing import List, Dict, Optional
-from app.models.schemas import ComplexityResponse, CaseDistribution
+from app.models.schemas import ComplexityResponse, CaseDistribution, CASE_NAMES, CASE_INDEX
 
 logger = logging.getLogger(__name__)
 
+# Universal Dependencies Case= tags mapped to their CaseDistribution slot;
+# any other tag (Ins, Abe, Com, ...) is counted as 'other'
+UD_CASE_INDEX = {
+    sys.intern(tag): CASE_INDEX[name] for tag, name in {
+        'Nom': 'nominative', 'Gen': 'genitive', 'Par': 'partitive',
+        'Ine': 'inessive', 'Ela': 'elative', 'Ill': 'illative',
+        'Ade': 'adessive', 'Abl': 'ablative', 'All': 'allative',
+        'Ess': 'essive', 'Tra': 'translative'
+    }.items()
+}
+OTHER_CASE_INDEX = CASE_INDEX['other']
+
+# Dependency relations that introduce a subordinate clause
+UDPIPE_CLAUSE_DEPRELS = frozenset({'acl', 'acl:relcl', 'advcl', 'ccomp', 'xcomp'})
+SPACY_CLAUSE_DEPRELS = frozenset({'acl', 'advcl', 'ccomp', 'xcomp', 'relcl'})
+
+# Word tokens (same tokens as \b[\w]+\b) and sentence separators
+WORD_RE = re.compile(r'\w+')
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Case value in a CoNLL-U FEATS column, e.g. "Case=Ine|Number=Sing"
+CASE_FEATURE_RE = re.compile(r'Case=([A-Za-z]+)')
+
+# Only .dep_, .morph, .sents and .is_punct are read, which need tok2vec,
+# tagger, morphologizer and parser; the rest would run for nothing
+SPACY_DISABLED_COMPONENTS = ["ner", "attribute_ruler", "lemmatizer"]
+
+# Only feeds the case counts, so it is also skipped when detailed=False
+SPACY_MORPH_COMPONENT = "morphologizer"
+
+
+def _spacy_disabled(detailed: bool) -> list:
+    """
+    Components to skip for one call
+
+    Passed per call rather than through select_pipes, which would change the
+    shared pipeline for requests running concurrently in other threads.
+    """
+    return [] if detailed else [SPACY_MORPH_COMPONENT]
+
+
+def _new_case_counts() -> array:
+    """Zeroed per-case counters, indexed like CASE_NAMES"""
+    return array('i', bytes(array('i').itemsize * len(CASE_NAMES)))
+
+
+def _split_text(text: str) -> tuple[List[str], List[str]]:
+    """Words and non-empty sentences of text, shared by every analysis path"""
+    words = WORD_RE.findall(text)
+    sentences = [s for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    return words, sentences
+
 
 class AdvancedComplexityEngine:
     """
@@ -16,13 +73,21 @@ class AdvancedComplexityEngine:
     Falls back to heuristics if libraries unavailable
     """
 
-    def __init__(self, use_udpipe: bool = True, use_spacy: bool = True):
+    def __init__(
+        self,
+        use_udpipe: bool = True,
+        use_spacy: bool = True,
+        spacy_batch_size: int = 32,
+        udpipe_threads: int = 0
+    ):
         """
         Initialize advanced complexity analyzer
 
         Args:
             use_udpipe: Try to use UDPipe for parsing
             use_spacy: Try to use spaCy for analysis
+            spacy_batch_size: Documents per nlp.pipe batch in analyze_batch
+            udpipe_threads: Parallel UDPipe parses in analyze_batch (0 = CPU count)
         """
         logger.info("Initializing Advanced Complexity Analysis Engine")
 
@@ -30,6 +95,11 @@ class AdvancedComplexityEngine:
         self.spacy_nlp = None
         self.use_udpipe = use_udpipe
         self.use_spacy = use_spacy
+        self.spacy_batch_size = spacy_batch_size
+        self.udpipe_threads = udpipe_threads or os.cpu_count()
+        self._udpipe_executor = None
+        # UDPipe Pipeline objects must not be shared between threads
+        self._udpipe_local = threading.local()
 
         # Try UDPipe
         if use_udpipe:
@@ -41,7 +111,11 @@ class AdvancedComplexityEngine:
                 try:
                     self.udpipe_model = Model.load(model_path)
                     if self.udpipe_model:
-                        self.udpipe_pipeline = Pipeline(self.udpipe_model, "tokenize", Pipeline.DEFAULT, Pipeline.DEFAULT, "conllu")
+                        self._udpipe_pipeline_cls = Pipeline
+                        self.udpipe_pipeline = self._get_udpipe_pipeline()
+                        self._udpipe_executor = ThreadPoolExecutor(
+                            max_workers=self.udpipe_threads, thread_name_prefix="udpipe"
+                        )
                         logger.info("✅ UDPipe model loaded successfully")
                     else:
                         raise Exception("Model file not found")
@@ -59,7 +133,7 @@ class AdvancedComplexityEngine:
             try:
                 import spacy
                 try:
-                    self.spacy_nlp = spacy.load("fi_core_news_sm")
+                    self.spacy_nlp = spacy.load("fi_core_news_sm", disable=SPACY_DISABLED_COMPONENTS)
                     logger.info("✅ spaCy Finnish model loaded successfully")
                 except OSError:
                     logger.warning("⚠️  spaCy Finnish model not found")
@@ -82,10 +156,29 @@ class AdvancedComplexityEngine:
         ]
         self.sentence_terminators = ['.', '!', '?']
 
-    def _analyze_with_udpipe(self, text: str) -> Optional[Dict]:
+        # Space-delimited clause markers and commas, counted in one scan
+        # (lookarounds let adjacent markers share the space between them)
+        self.clause_boundary_re = re.compile(
+            '(?<= )(?:' + '|'.join(map(re.escape, self.clause_markers)) + ')(?= )|,'
+        )
+
+    def _get_udpipe_pipeline(self):
+        """UDPipe pipeline owned by the calling thread, created on first use"""
+        pipeline = getattr(self._udpipe_local, 'pipeline', None)
+        if pipeline is None:
+            Pipeline = self._udpipe_pipeline_cls
+            pipeline = Pipeline(self.udpipe_model, "tokenize", Pipeline.DEFAULT, Pipeline.DEFAULT, "conllu")
+            self._udpipe_local.pipeline = pipeline
+        return pipeline
+
+    def _analyze_with_udpipe(self, text: str, detailed: bool = True) -> Optional[Dict]:
         """
         Analyze text using UDPipe for dependency parsing
 
+        Args:
+            text: Input Finnish text
+            detailed: Count cases from the FEATS column
+
         Returns:
             Dict with parse tree and metrics
         """
@@ -93,29 +186,30 @@ class AdvancedComplexityEngine:
             return None
 
         try:
-            processed = self.udpipe_pipeline.process(text)
+            processed = self._get_udpipe_pipeline().process(text)
             lines = processed.split('\n')
 
             clauses = 0
             words = 0
-            cases = {}
+            cases = _new_case_counts()
 
             for line in lines:
-                if line and not line.startswith('#'):
-                    parts = line.split('\t')
-                    if len(parts) >= 10:
-                        words += 1
-
-                        # Count clauses based on dependency relations
-                        dep_rel = parts[7]  # Dependency relation
-                        if dep_rel in ['acl', 'acl:relcl', 'advcl', 'ccomp', 'xcomp']:
-                            clauses += 1
-
-                        # Extract case information from features
-                        feats = parts[5]
-                        if 'Case=' in feats:
-                            case = feats.split('Case=')[1].split('|')[0]
-                            cases[case] = cases.get(case, 0) + 1
+                # Token rows have 10 columns; only FEATS (5) and DEPREL (7)
+                # are read, so the trailing DEPS/MISC columns are left unsplit
+                if line and not line.startswith('#') and line.count('\t') >= 9:
+                    parts = line.split('\t', 8)
+                    words += 1
+
+                    # Count clauses based on dependency relations
+                    dep_rel = parts[7]  # Dependency relation
+                    if dep_rel in UDPIPE_CLAUSE_DEPRELS:
+                        clauses += 1
+
+                    # Extract case information from features
+                    if detailed:
+                        match = CASE_FEATURE_RE.search(parts[5])
+                        if match:
+                            cases[UD_CASE_INDEX.get(match.group(1), OTHER_CASE_INDEX)] += 1
 
             return {
                 'clauses': max(clauses, 1),
@@ -127,10 +221,14 @@ class AdvancedComplexityEngine:
             logger.warning(f"UDPipe analysis failed: {e}")
             return None
 
-    def _analyze_with_spacy(self, text: str) -> Optional[Dict]:
+    def _analyze_with_spacy(self, text: str, detailed: bool = True) -> Optional[Dict]:
         """
         Analyze text using spaCy
 
+        Args:
+            text: Input Finnish text
+            detailed: Run the morphologizer and count cases
+
         Returns:
             Dict with analysis results
         """
@@ -138,49 +236,52 @@ class AdvancedComplexityEngine:
             return None
 
         try:
-            doc = self.spacy_nlp(text)
-
-            clauses = 0
-            words = len([token for token in doc if not token.is_punct])
-            cases = {}
-
-            for sent in doc.sents:
-                # Count subordinate clauses
-                for token in sent:
-                    if token.dep_ in ['acl', 'advcl', 'ccomp', 'xcomp', 'relcl']:
-                        clauses += 1
-
-                    # Extract morphological case
-                    if 'Case' in token.morph:
-                        case = str(token.morph.get('Case')[0]) if token.morph.get('Case') else 'Nom'
-                        cases[case] = cases.get(case, 0) + 1
-
-            return {
-                'clauses': max(clauses, len(list(doc.sents))),
-                'words': words,
-                'cases': cases,
-                'method': 'spacy'
-            }
+            doc = self.spacy_nlp(text, disable=_spacy_disabled(detailed))
+            return self._spacy_doc_metrics(doc, detailed)
         except Exception as e:
             logger.warning(f"spaCy analysis failed: {e}")
             return None
 
-    def _analyze_with_heuristics(self, text: str) -> Dict:
-        """Fallback heuristic analysis"""
-        sentences = [s for s in re.split(r'[.!?]+', text) if s.strip()]
-        words = re.findall(r'\b[\w]+\b', text)
+    def _spacy_doc_metrics(self, doc, detailed: bool = True) -> Dict:
+        """
+        Extract clause, word and (when detailed) case counts from a parsed spaCy Doc
+        """
+        clauses = 0
+        sentences = 0
+        words = sum(1 for token in doc if not token.is_punct)
+        cases = _new_case_counts()
+
+        for sent in doc.sents:
+            sentences += 1
+            # Count subordinate clauses
+            for token in sent:
+                if token.dep_ in SPACY_CLAUSE_DEPRELS:
+                    clauses += 1
+
+                # Extract morphological case (one morph lookup per token)
+                if detailed:
+                    case_values = token.morph.get('Case')
+                    if case_values:
+                        cases[UD_CASE_INDEX.get(case_values[0], OTHER_CASE_INDEX)] += 1
+
+        return {
+            'clauses': max(clauses, sentences),
+            'words': words,
+            'cases': cases,
+            'method': 'spacy'
+        }
+
+    def _analyze_with_heuristics(self, text: str, words: List[str], sentences: List[str]) -> Dict:
+        """Fallback heuristic analysis over already split words and sentences"""
 
         # Count clauses (commas + clause markers)
         clauses = len(sentences)
-        text_lower = text.lower()
-        for marker in self.clause_markers:
-            clauses += text_lower.count(f' {marker} ')
-        clauses += text.count(',')
+        clauses += sum(1 for _ in self.clause_boundary_re.finditer(text.lower()))
 
         return {
             'clauses': max(clauses, 1),
             'words': len(words),
-            'cases': {},  # Can't reliably detect without parsing
+            'cases': _new_case_counts(),  # Can't reliably detect without parsing
             'method': 'heuristic'
         }
 
@@ -191,7 +292,7 @@ class AdvancedComplexityEngine:
         score = 0.0
 
         # Factor 1: Case variety (0-30 points)
-        unique_cases = len(analysis.get('cases', {}))
+        unique_cases = sum(1 for count in analysis['cases'] if count)
         score += min(unique_cases * 3, 30)
 
         # Factor 2: Average word length (0-30 points)
@@ -231,17 +332,76 @@ class AdvancedComplexityEngine:
         """
         logger.info(f"Analyzing complexity for text: {text[:50]}...")
 
+        # Split once; heuristics and the final metrics reuse the result
+        words, sentences = _split_text(text)
+
         # Try analysis methods in order
-        analysis = (self._analyze_with_udpipe(text) or
-                    self._analyze_with_spacy(text) or
-                    self._analyze_with_heuristics(text))
+        analysis = (self._analyze_with_udpipe(text, detailed) or
+                    self._analyze_with_spacy(text, detailed) or
+                    self._analyze_with_heuristics(text, words, sentences))
+
+        return self._build_response(text, analysis, detailed, words, sentences)
+
+    def analyze_batch(self, texts: List[str], detailed: bool = True) -> List[ComplexityResponse]:
+        """
+        Analyze several texts, streaming them through spaCy with nlp.pipe
+
+        nlp.pipe amortizes per-call pipeline overhead across documents.
+        UDPipe, when loaded, takes priority as in analyze(); its parser
+        releases the GIL, so texts are parsed in parallel threads, each with
+        its own pipeline.
+
+        Args:
+            texts: Input Finnish texts
+            detailed: Include detailed analysis
 
+        Returns:
+            List of ComplexityResponse, in input order
+        """
+        if self.udpipe_model and len(texts) > 1:
+            return list(self._udpipe_executor.map(lambda text: self.analyze(text, detailed=detailed), texts))
+
+        if self.udpipe_model or not self.spacy_nlp:
+            return [self.analyze(text, detailed=detailed) for text in texts]
+
+        try:
+            docs = self.spacy_nlp.pipe(
+                texts,
+                batch_size=self.spacy_batch_size,
+                disable=_spacy_disabled(detailed)
+            )
+            analyses = [self._spacy_doc_metrics(doc, detailed) for doc in docs]
+        except Exception as e:
+            logger.warning(f"spaCy batch analysis failed, analyzing one by one: {e}")
+            return [self.analyze(text, detailed=detailed) for text in texts]
+
+        return [
+            self._build_response(text, analysis, detailed, *_split_text(text))
+            for text, analysis in zip(texts, analyses)
+        ]
+
+    def _build_response(
+        self,
+        text: str,
+        analysis: Dict,
+        detailed: bool,
+        words: List[str],
+        sentences: List[str]
+    ) -> ComplexityResponse:
+        """
+        Turn raw analysis counts into a ComplexityResponse
+
+        Args:
+            text: Analyzed text
+            analysis: Counts from UDPipe, spaCy or the heuristics
+            detailed: Include case distribution
+            words: Word tokens of text
+            sentences: Non-empty sentences of text
+        """
         method = analysis.get('method', 'unknown')
         logger.info(f"Using analysis method: {method}")
 
         # Calculate metrics
-        words = re.findall(r'\b[\w]+\b', text)
-        sentences = len([s for s in re.split(r'[.!?]+', text) if s.strip()])
         word_count = analysis['words']
         clause_count = analysis['clauses']
         avg_word_length = round(sum(len(w) for w in words) / max(len(words), 1), 2)
@@ -249,20 +409,7 @@ class AdvancedComplexityEngine:
         # Case distribution
         case_distribution = None
         if detailed:
-            case_map = {
-                'Nom': 'nominative', 'Gen': 'genitive', 'Par': 'partitive',
-                'Ine': 'inessive', 'Ela': 'elative', 'Ill': 'illative',
-                'Ade': 'adessive', 'Abl': 'ablative', 'All': 'allative',
-                'Ess': 'essive', 'Tra': 'translative'
-            }
-
-            case_dist = CaseDistribution()
-            for case, count in analysis.get('cases', {}).items():
-                field_name = case_map.get(case, 'other')
-                if hasattr(case_dist, field_name):
-                    setattr(case_dist, field_name, count)
-
-            case_distribution = case_dist
+            case_distribution = CaseDistribution.model_construct(**dict(zip(CASE_NAMES, analysis['cases'])))
 
         # Morphological depth
         morph_score = self._calculate_morphological_depth(analysis, avg_word_length)
@@ -270,9 +417,9 @@ class AdvancedComplexityEngine:
         # Complexity rating
         complexity_rating = self._determine_complexity_rating(morph_score, clause_count, word_count)
 
-        result = ComplexityResponse(
+        result = ComplexityResponse.model_construct(
             text=text,
-            sentence_count=sentences,
+            sentence_count=len(sentences),
             word_count=word_count,
             clause_count=clause_count,
             morphological_depth_score=morph_score,
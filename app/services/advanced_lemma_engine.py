@@ -2,12 +2,18 @@
 Advanced Finnish Lemmatizer Engine with Voikko Integration
 Real morphological analysis for Finnish language
 """
+import functools
 import logging
+import re
+import threading
 from typing import List, Dict, Optional
 from app.models.schemas import LemmatizationResponse, WordLemma
 
 logger = logging.getLogger(__name__)
 
+# Word tokens: runs of word characters (same tokens as \b[\w]+\b)
+WORD_RE = re.compile(r'\w+')
+
 
 class AdvancedLemmatizerEngine:
     """
@@ -15,17 +21,21 @@ class AdvancedLemmatizerEngine:
     Fallback to rule-based for unavailable words
     """
 
-    def __init__(self, use_voikko: bool = True):
+    def __init__(self, use_voikko: bool = True, word_cache_size: int = 50000):
         """
         Initialize advanced lemmatizer
 
         Args:
             use_voikko: Try to use libvoikko if available, fallback to rules
+            word_cache_size: Distinct (word, include_morphology) results to keep
         """
         logger.info("Initializing Advanced Finnish Lemmatizer Engine")
 
         self.voikko = None
         self.use_voikko = use_voikko
+        # One libvoikko handle is shared by every request thread and is not
+        # thread-safe, so analyze calls are serialized
+        self._voikko_lock = threading.Lock()
 
         # Try to import and initialize Voikko
         if use_voikko:
@@ -45,6 +55,10 @@ class AdvancedLemmatizerEngine:
         # Fallback rule-based patterns
         self._init_fallback_rules()
 
+        # Word frequencies are Zipfian ("ja", "on", "ei", ...), so most tokens
+        # repeat; cache per-word results to skip repeated Voikko calls
+        self._lemmatize_word_cached = functools.lru_cache(maxsize=word_cache_size)(self._lemmatize_word)
+
         logger.info(f"Lemmatizer initialized (Voikko: {'enabled' if self.voikko else 'disabled'})")
 
     def _init_fallback_rules(self):
@@ -61,6 +75,11 @@ class AdvancedLemmatizerEngine:
             'essive': ['na', 'nä'],
             'translative': ['ksi'],
         }
+        # (case, suffixes longest first), sorted once rather than per word
+        self._case_suffixes_sorted = [
+            (case, tuple(sorted(suffixes, key=len, reverse=True)))
+            for case, suffixes in self.case_suffixes.items()
+        ]
 
         self.known_words = {
             'kissa': ['kissa', 'kissan', 'kissaa', 'kissassa', 'kissasta'],
@@ -72,6 +91,13 @@ class AdvancedLemmatizerEngine:
             'juosta': ['juokse', 'juoksi', 'juoksee', 'juoksivat'],
         }
 
+        # Reverse index (form -> lemma) for O(1) lookup; the first lemma
+        # listing a form wins, as with the linear search it replaces
+        self._form_to_lemma = {}
+        for lemma, forms in self.known_words.items():
+            for form in forms:
+                self._form_to_lemma.setdefault(form, lemma)
+
     def _voikko_analyze(self, word: str) -> Optional[Dict]:
         """
         Analyze word using Voikko
@@ -83,7 +109,8 @@ class AdvancedLemmatizerEngine:
             return None
 
         try:
-            analyses = self.voikko.analyze(word)
+            with self._voikko_lock:
+                analyses = self.voikko.analyze(word)
             if not analyses:
                 return None
 
@@ -108,19 +135,19 @@ class AdvancedLemmatizerEngine:
         word_lower = word.lower()
 
         # Check known words
-        for lemma, forms in self.known_words.items():
-            if word_lower in forms:
-                return {
-                    'lemma': lemma,
-                    'pos': 'VERB' if lemma.endswith(('da', 'dä', 'ta', 'tä')) else 'NOUN',
-                    'case': 'Nominative',
-                    'number': 'Singular'
-                }
+        lemma = self._form_to_lemma.get(word_lower)
+        if lemma:
+            return {
+                'lemma': lemma,
+                'pos': 'VERB' if lemma.endswith(('da', 'dä', 'ta', 'tä')) else 'NOUN',
+                'case': 'Nominative',
+                'number': 'Singular'
+            }
 
         # Rule-based lemmatization
         lemma = word_lower
-        for case, suffixes in self.case_suffixes.items():
-            for suffix in sorted(suffixes, key=len, reverse=True):
+        for case, suffixes in self._case_suffixes_sorted:
+            for suffix in suffixes:
                 if lemma.endswith(suffix) and len(lemma) > len(suffix) + 2:
                     lemma = lemma[:-len(suffix)]
                     break
@@ -161,7 +188,7 @@ class AdvancedLemmatizerEngine:
                 if voikko_result.get('person'):
                     morphology['person'] = voikko_result['person']
 
-            return WordLemma(
+            return WordLemma.model_construct(
                 original=word,
                 lemma=voikko_result['lemma'],
                 pos=voikko_result.get('pos', 'UNKNOWN'),
@@ -178,7 +205,7 @@ class AdvancedLemmatizerEngine:
                     'number': analysis['number']
                 }
 
-            return WordLemma(
+            return WordLemma.model_construct(
                 original=word,
                 lemma=analysis['lemma'],
                 pos=analysis['pos'],
@@ -198,18 +225,13 @@ class AdvancedLemmatizerEngine:
         """
         logger.info(f"Lemmatizing text: {text[:50]}... (Voikko: {bool(self.voikko)})")
 
-        # Tokenize (simple word extraction)
-        import re
-        tokens = re.findall(r'\b[\w]+\b', text)
-
-        # Lemmatize each word
-        lemmas = []
-        for token in tokens:
-            if token.strip():
-                word_lemma = self._lemmatize_word(token, include_morphology)
-                lemmas.append(word_lemma)
+        # Tokenize (simple word extraction) and lemmatize each word
+        lemmas = [
+            self._lemmatize_word_cached(token, include_morphology)
+            for token in WORD_RE.findall(text)
+        ]
 
-        result = LemmatizationResponse(
+        result = LemmatizationResponse.model_construct(
             text=text,
             lemmas=lemmas,
             word_count=len(lemmas)
@@ -219,7 +241,10 @@ class AdvancedLemmatizerEngine:
         return result
 
     def __del__(self):
-        """Cleanup Voikko instance"""
+        """Cleanup word cache and Voikko instance"""
+        cached = getattr(self, "_lemmatize_word_cached", None)
+        if cached is not None:
+            cached.cache_clear()
         if self.voikko:
             try:
                 self.voikko.terminate()
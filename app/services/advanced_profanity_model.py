@@ -6,9 +6,27 @@ import re
 import logging
 from typing import List, Optional
 from app.models.schemas import ProfanityResponse, FlaggedWord
+from app.utils.keyword_matcher import PrefixKeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Escapes such as \w* or \s+ in a toxic phrase pattern; what remains must be literal words
+_PATTERN_ESCAPE_RE = re.compile(r'\\[a-zA-Z][*+?]?')
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Longest literal word every match of a toxic phrase pattern contains
+
+    Patterns may only combine words with escapes like \\w* and \\s+; anything
+    else (groups, alternation, optional letters) raises ValueError rather
+    than yielding a literal the prefilter could wrongly rely on.
+    """
+    parts = [part for part in _PATTERN_ESCAPE_RE.split(pattern) if part]
+    if not parts or not all(part.isalpha() for part in parts):
+        raise ValueError(f"Cannot derive a prefilter literal from toxic pattern {pattern!r}")
+    return max(parts, key=len)
+
 
 class AdvancedProfanityDetector:
     """
@@ -26,6 +44,8 @@ class AdvancedProfanityDetector:
 
         self.model = None
         self.tokenizer = None
+        self.device = "cpu"
+        self.torch = None  # torch module, bound once at load (optional dependency)
         self.use_transformers = use_transformers
 
         # Try to load transformer model
@@ -33,6 +53,7 @@ class AdvancedProfanityDetector:
             try:
                 from transformers import AutoTokenizer, AutoModelForSequenceClassification
                 import torch
+                self.torch = torch
 
                 # Try to load FinBERT-based toxicity model
                 # Note: You would need to train or download a toxicity classification model
@@ -47,6 +68,10 @@ class AdvancedProfanityDetector:
                     logger.warning("⚠️  Full toxicity model not loaded - using keyword fallback")
                     logger.warning("To use ML model, train on Finnish toxicity dataset")
                     self.model = None  # Set to None since we don't have trained model
+                    # Run on GPU when present (model and inputs must share a device)
+                    self.device = "cuda" if torch.cuda.is_available() else "cpu"
+                    if self.model is not None:
+                        self.model.to(self.device).eval()
                 except Exception as e:
                     logger.warning(f"⚠️  Could not load transformer model: {e}")
                     self.model = None
@@ -115,12 +140,22 @@ class AdvancedProfanityDetector:
             r'ole\w*\s+hiljaa',
             r'sinä\s+idiootti',
         ]
+        # A literal every toxic phrase above must contain
+        toxic_phrase_literals = [_required_literal(pattern) for pattern in self.toxic_patterns]
 
-        # Build regex patterns for morphological variants
-        self.profanity_patterns = {}
-        for word, severity in self.profanity_words.items():
-            pattern = rf'\b{word}\w*\b'
-            self.profanity_patterns[pattern] = severity
+        # Toxic phrase patterns, compiled once
+        self.toxic_res = [re.compile(pattern) for pattern in self.toxic_patterns]
+
+        # Matcher for morphological variants (any word starting with a profanity word)
+        self.profanity_patterns = PrefixKeywordMatcher(self.profanity_words)
+
+        # Prefilter: any keyword match or toxic phrase contains one of these
+        # substrings; a literal that contains another (paskapuhe/paska) is redundant
+        literals = set(self.profanity_words) | set(toxic_phrase_literals)
+        self._trigger_substrings = tuple(sorted(
+            literal for literal in literals
+            if not any(other != literal and other in literal for other in literals)
+        ))
 
     def _detect_with_ml(self, text: str) -> Optional[float]:
         """
@@ -133,13 +168,13 @@ class AdvancedProfanityDetector:
             return None
 
         try:
-            import torch
+            torch = self.torch
 
             # Tokenize
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
+            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512).to(self.device)
 
-            # Get prediction
-            with torch.no_grad():
+            # Get prediction (inference_mode skips autograd bookkeeping entirely)
+            with torch.inference_mode():
                 outputs = self.model(**inputs)
                 logits = outputs.logits
                 probabilities = torch.nn.functional.softmax(logits, dim=-1)
@@ -153,6 +188,33 @@ class AdvancedProfanityDetector:
             logger.warning(f"ML detection failed: {e}")
             return None
 
+    def _detect_with_ml_batch(self, texts: List[str]) -> Optional[List[float]]:
+        """
+        Detect toxicity for several texts with one model forward pass
+
+        Returns:
+            Toxicity scores (0-1) in input order or None if model unavailable
+        """
+        if not self.model or not self.tokenizer:
+            return None
+
+        try:
+            torch = self.torch
+
+            inputs = self.tokenizer(
+                texts, return_tensors="pt", truncation=True, padding=True, max_length=512
+            ).to(self.device)
+
+            with torch.inference_mode():
+                logits = self.model(**inputs).logits
+                probabilities = torch.nn.functional.softmax(logits, dim=-1)
+
+            return probabilities[:, 1].tolist()
+
+        except Exception as e:
+            logger.warning(f"ML batch detection failed: {e}")
+            return None
+
     def _detect_with_keywords(self, text: str) -> tuple[float, List[tuple]]:
         """
         Detect toxicity using keyword matching
@@ -161,23 +223,21 @@ class AdvancedProfanityDetector:
             (toxicity_score, findings)
             findings: List of (word, position, confidence)
         """
-        findings = []
         text_lower = text.lower()
 
-        # Check profanity patterns
-        for pattern, severity in self.profanity_patterns.items():
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                findings.append((
-                    match.group(),
-                    match.start(),
-                    severity
-                ))
+        # Clean text (the common case) is rejected with C-level substring
+        # checks before tokenizing and running the phrase regexes
+        if not any(trigger in text_lower for trigger in self._trigger_substrings):
+            return 0.0, []
 
-        # Check toxic phrases
-        for pattern in self.toxic_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
+        # Words starting with a profanity keyword (covers morphological variants);
+        # the same pass counts words for the density factor
+        findings, word_count = self.profanity_patterns.scan(text_lower)
+
+        # Check toxic phrases (one scan per pattern, so overlapping phrases
+        # such as 'kuole' and 'ole tyhmä' are both found)
+        for pattern in self.toxic_res:
+            for match in pattern.finditer(text_lower):
                 findings.append((
                     match.group(),
                     match.start(),
@@ -190,8 +250,7 @@ class AdvancedProfanityDetector:
 
         # Average severity weighted by density
         avg_severity = sum(f[2] for f in findings) / len(findings)
-        words = re.findall(r'\b[\w]+\b', text)
-        density_factor = min(len(findings) / max(len(words), 1) * 10, 1.0)
+        density_factor = min(len(findings) / max(word_count, 1) * 10, 1.0)
 
         toxicity_score = min((avg_severity * 0.7) + (density_factor * 0.3), 1.0)
 
@@ -225,11 +284,43 @@ class AdvancedProfanityDetector:
         Returns:
             ProfanityResponse
         """
-        logger.info(f"Checking profanity for text: {text[:50]}... (ML: {bool(self.model)})")
+        # Lazy %-style arguments: nothing is formatted unless INFO is enabled
+        logger.info("Checking profanity for text: %.50s... (ML: %s)", text, self.model is not None)
 
-        # Try ML detection first
         ml_score = self._detect_with_ml(text)
+        return self._build_response(text, ml_score, return_flagged_words, threshold)
+
+    def detect_batch(
+        self,
+        texts: List[str],
+        return_flagged_words: bool = False,
+        threshold: float = 0.5
+    ) -> List[ProfanityResponse]:
+        """
+        Detect profanity for several texts, sharing one ML forward pass
 
+        Args:
+            texts: Input texts to check
+            return_flagged_words: Return list of flagged words
+            threshold: Detection threshold (0-1)
+
+        Returns:
+            List of ProfanityResponse in input order
+        """
+        ml_scores = self._detect_with_ml_batch(texts) or [None] * len(texts)
+        return [
+            self._build_response(text, ml_score, return_flagged_words, threshold)
+            for text, ml_score in zip(texts, ml_scores)
+        ]
+
+    def _build_response(
+        self,
+        text: str,
+        ml_score: Optional[float],
+        return_flagged_words: bool,
+        threshold: float
+    ) -> ProfanityResponse:
+        """Build response from an ML score, falling back to keywords when it is missing"""
         if ml_score is not None:
             # Use ML score
             toxicity_score = ml_score
@@ -244,7 +335,7 @@ class AdvancedProfanityDetector:
             flagged_words = None
             if return_flagged_words and findings:
                 flagged_words = [
-                    FlaggedWord(
+                    FlaggedWord.model_construct(
                         word=word,
                         position=position,
                         confidence=confidence
@@ -258,7 +349,7 @@ class AdvancedProfanityDetector:
         # Determine severity
         severity = self._determine_severity(toxicity_score)
 
-        result = ProfanityResponse(
+        result = ProfanityResponse.model_construct(
             text=text,
             is_toxic=is_toxic,
             toxicity_score=toxicity_score,
@@ -266,5 +357,5 @@ class AdvancedProfanityDetector:
             severity=severity
         )
 
-        logger.info(f"Profanity check complete: {severity} severity ({toxicity_score} score) using {method}")
+        logger.info("Profanity check complete: %s severity (%s score) using %s", severity, toxicity_score, method)
         return result
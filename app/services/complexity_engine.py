@@ -4,11 +4,51 @@ Analyzes sentence complexity, morphological depth, and grammatical features
 """
 import re
 import logging
-from typing import List, Dict
-from app.models.schemas import ComplexityResponse, CaseDistribution
+from functools import lru_cache
+from typing import List, Dict, Tuple
+from app.models.schemas import ComplexityResponse, CaseDistribution, CASE_NAMES, CASE_INDEX
 
 logger = logging.getLogger(__name__)
 
+# One scan over the text: a word, a sentence terminator or a comma
+TEXT_SCAN_RE = re.compile(r'(\w+)|([.!?])|(,)')
+
+# Case suffixes: a word is in a case when it ends with one of its suffixes
+# and is longer than that suffix.
+# A word in none of these cases counts as nominative.
+CASE_SUFFIXES = {
+    'genitive': ('n',),
+    'partitive': ('a', 'ä', 'ta', 'tä'),
+    'inessive': ('ssa', 'ssä'),
+    'elative': ('sta', 'stä'),
+    'illative': ('an', 'än', 'seen', 'hin', 'hon', 'hön'),
+    'adessive': ('lla', 'llä'),
+    'ablative': ('lta', 'ltä'),
+    'allative': ('lle',),
+    'essive': ('na', 'nä'),
+    'translative': ('ksi',),
+}
+
+# Suffix -> case indices it marks, probed with the word's last 1-4 characters
+_SUFFIX_CASES: Dict[str, Tuple[int, ...]] = {}
+for _case, _suffixes in CASE_SUFFIXES.items():
+    for _suffix in _suffixes:
+        _SUFFIX_CASES[_suffix] = _SUFFIX_CASES.get(_suffix, ()) + (CASE_INDEX[_case],)
+_MAX_SUFFIX_LEN = max(map(len, _SUFFIX_CASES))
+_NOMINATIVE_INDEX = CASE_INDEX['nominative']
+
+# Inflected cases that count towards case variety (not nominative or other)
+INFLECTED_CASE_INDICES = tuple(CASE_INDEX[case] for case in CASE_SUFFIXES)
+
+
+@lru_cache(maxsize=50000)
+def _word_case_indices(word: str) -> Tuple[int, ...]:
+    """Case indices a lowercase word counts towards (each at most once)"""
+    found = set()
+    for length in range(1, min(_MAX_SUFFIX_LEN, len(word) - 1) + 1):
+        found.update(_SUFFIX_CASES.get(word[-length:], ()))
+    return tuple(found) if found else (_NOMINATIVE_INDEX,)
+
 
 class ComplexityEngine:
     """
@@ -24,25 +64,12 @@ class ComplexityEngine:
             'joka', 'mikä', 'että', 'kun', 'jos', 'koska', 'vaikka',
             'kuin', 'kuten', 'jotta', 'kunnes', 'siksi', 'eli'
         ]
+        # Set for per-word lookups in _scan
+        self._clause_marker_set = frozenset(self.clause_markers)
 
         # Sentence terminators
         self.sentence_terminators = ['.', '!', '?']
 
-        # Case markers for detection
-        self.case_patterns = {
-            'nominative': r'\b\w+\b(?![a-zäö])',  # Base form
-            'genitive': r'\b\w+n\b',
-            'partitive': r'\b\w+(a|ä|ta|tä)\b',
-            'inessive': r'\b\w+(ssa|ssä)\b',
-            'elative': r'\b\w+(sta|stä)\b',
-            'illative': r'\b\w+(an|än|seen|hin|hon|hön)\b',
-            'adessive': r'\b\w+(lla|llä)\b',
-            'ablative': r'\b\w+(lta|ltä)\b',
-            'allative': r'\b\w+lle\b',
-            'essive': r'\b\w+(na|nä)\b',
-            'translative': r'\b\w+ksi\b',
-        }
-
         # Morphological complexity indicators
         self.complexity_indicators = {
             'long_words': 10,  # Words longer than this are complex
@@ -52,111 +79,107 @@ class ComplexityEngine:
 
         logger.info("Complexity analyzer initialized successfully")
 
-    def _split_sentences(self, text: str) -> List[str]:
-        """
-        Split text into sentences
-        """
-        sentences = []
-        current_sentence = ""
-
-        for char in text:
-            current_sentence += char
-            if char in self.sentence_terminators:
-                sentences.append(current_sentence.strip())
-                current_sentence = ""
-
-        if current_sentence.strip():
-            sentences.append(current_sentence.strip())
-
-        return [s for s in sentences if s]
-
     def _count_clauses(self, text: str) -> int:
         """
         Count number of clauses in text
         Clauses are separated by clause markers or commas
         """
-        # Base clause count (at least 1 per sentence)
-        sentences = self._split_sentences(text)
-        clause_count = len(sentences)
-
-        # Add clauses based on markers
-        text_lower = text.lower()
-        for marker in self.clause_markers:
-            clause_count += text_lower.count(f' {marker} ')
-            clause_count += text_lower.count(f',{marker} ')
-
-        # Count commas as potential clause separators
-        clause_count += text.count(',')
-
-        return max(clause_count, 1)
+        return self._scan(text, count_cases=False)['clause_count']
 
     def _analyze_case_distribution(self, text: str) -> CaseDistribution:
         """
         Analyze distribution of grammatical cases in text
         """
-        text_lower = text.lower()
-        distribution = CaseDistribution()
-
-        # Count each case
-        for case, pattern in self.case_patterns.items():
-            matches = re.findall(pattern, text_lower)
-            count = len(matches)
-
-            # Set the count for each case
-            if case == 'nominative':
-                distribution.nominative = count
-            elif case == 'genitive':
-                distribution.genitive = count
-            elif case == 'partitive':
-                distribution.partitive = count
-            elif case == 'inessive':
-                distribution.inessive = count
-            elif case == 'elative':
-                distribution.elative = count
-            elif case == 'illative':
-                distribution.illative = count
-            elif case == 'adessive':
-                distribution.adessive = count
-            elif case == 'ablative':
-                distribution.ablative = count
-            elif case == 'allative':
-                distribution.allative = count
-            elif case == 'essive':
-                distribution.essive = count
-            elif case == 'translative':
-                distribution.translative = count
-
-        return distribution
-
-    def _calculate_morphological_depth(self, text: str, case_dist: CaseDistribution) -> float:
+        counts = self._scan(text)['case_counts']
+        return CaseDistribution.model_construct(**dict(zip(CASE_NAMES, counts)))
+
+    def _scan(self, text: str, count_cases: bool = True) -> Dict:
+        """
+        Collect every per-text count in one pass over the text
+
+        Sentences end at each terminator ('.', '!', '?'), plus one for
+        trailing text; clauses are one per sentence plus each clause marker
+        (after a space or comma, before a space) and each comma; each word is
+        classified by its case ending (CASE_SUFFIXES).
+
+        Args:
+            text: Input text
+            count_cases: Classify words by case (only needed when detailed)
+
+        Returns:
+            Dict with words, sentence_count, clause_count and case_counts
+        """
+        words = []
+        terminators = 0
+        commas = 0
+        markers = 0
+        case_counts = [0] * len(CASE_NAMES)
+        markers_set = self._clause_marker_set
+        text_end = len(text)
+        last_terminator_end = 0
+
+        # Scan the original text and lowercase word by word: lower() can
+        # change the length of the whole text ('İ'), which would shift spans
+        for match in TEXT_SCAN_RE.finditer(text):
+            kind = match.lastindex
+            if kind == 1:
+                start, end = match.span()
+                original = match.group()
+                words.append(original)
+                word = original.lower()
+                if (word in markers_set and start > 0 and text[start - 1] in ' ,'
+                        and end < text_end and text[end] == ' '):
+                    markers += 1
+                if count_cases:
+                    for index in _word_case_indices(word):
+                        case_counts[index] += 1
+            elif kind == 2:
+                terminators += 1
+                last_terminator_end = match.end()
+            else:
+                commas += 1
+
+        # Every terminator closes a sentence; trailing text is one more
+        sentence_count = terminators + (1 if text[last_terminator_end:].strip() else 0)
+
+        return {
+            'words': words,
+            'sentence_count': sentence_count,
+            'clause_count': max(sentence_count + markers + commas, 1),
+            'case_counts': case_counts,
+        }
+
+    def _calculate_morphological_depth(
+        self,
+        case_counts: List[int],
+        words: List[str],
+        sentence_count: int,
+        clause_count: int
+    ) -> float:
         """
         Calculate morphological depth score (0-100)
         Higher score = more complex morphology
+
+        Args:
+            case_counts: Per-case counts indexed like CASE_NAMES (all zero when not detailed)
+            words: Word tokens of the text
+            sentence_count: Number of sentences in the text
+            clause_count: Clause count of the text
         """
         score = 0.0
 
         # Factor 1: Case variety (max 30 points)
-        cases_used = sum([
-            1 for count in [
-                case_dist.genitive, case_dist.partitive, case_dist.inessive,
-                case_dist.elative, case_dist.illative, case_dist.adessive,
-                case_dist.ablative, case_dist.allative, case_dist.essive,
-                case_dist.translative
-            ] if count > 0
-        ])
+        cases_used = sum(1 for index in INFLECTED_CASE_INDICES if case_counts[index])
         score += min(cases_used * 3, 30)
 
         # Factor 2: Average word length (max 30 points)
-        words = re.findall(r'\b[\w]+\b', text)
         if words:
             avg_length = sum(len(w) for w in words) / len(words)
             score += min(avg_length * 3, 30)
 
         # Factor 3: Clause density (max 40 points)
-        sentences = self._split_sentences(text)
-        if sentences:
-            clauses = self._count_clauses(text)
-            clause_density = clauses / len(sentences)
+        if sentence_count:
+            clause_density = clause_count / sentence_count
             score += min(clause_density * 20, 40)
 
         return round(min(score, 100), 2)
@@ -188,33 +211,28 @@ class ComplexityEngine:
         """
         logger.info(f"Analyzing complexity for text: {text[:50]}...")
 
-        # Basic metrics
-        sentences = self._split_sentences(text)
-        words = re.findall(r'\b[\w]+\b', text)
-        sentence_count = len(sentences)
+        # Words, sentences, clauses and (if detailed) cases in one pass
+        scan = self._scan(text, count_cases=detailed)
+        words = scan['words']
+        sentence_count = scan['sentence_count']
         word_count = len(words)
-
-        # Clause analysis
-        clause_count = self._count_clauses(text)
+        clause_count = scan['clause_count']
 
         # Case distribution (if detailed)
         case_distribution = None
         if detailed:
-            case_distribution = self._analyze_case_distribution(text)
+            case_distribution = CaseDistribution.model_construct(**dict(zip(CASE_NAMES, scan['case_counts'])))
 
-        # Morphological depth
-        if detailed and case_distribution:
-            morph_score = self._calculate_morphological_depth(text, case_distribution)
-        else:
-            morph_score = self._calculate_morphological_depth(text, CaseDistribution())
+        # Morphological depth (case counts stay zero when not detailed)
+        morph_score = self._calculate_morphological_depth(scan['case_counts'], words, sentence_count, clause_count)
 
         # Average word length
-        avg_word_length = round(sum(len(w) for w in words) / max(len(words), 1), 2) if words else 0
+        avg_word_length = round(sum(len(w) for w in words) / max(len(words), 1), 2) if words else 0.0
 
         # Complexity rating
         complexity_rating = self._determine_complexity_rating(morph_score, clause_count, word_count)
 
-        result = ComplexityResponse(
+        result = ComplexityResponse.model_construct(
             text=text,
             sentence_count=sentence_count,
             word_count=word_count,
@@ -2,13 +2,209 @@
 Finnish Lemmatizer Engine
 Implements rule-based lemmatization with morphological analysis
 """
+import functools
 import re
+import sys
 import logging
 from typing import List, Dict, Optional
 from app.models.schemas import LemmatizationResponse, WordLemma
 
 logger = logging.getLogger(__name__)
 
+# Word tokens: runs of word characters (same tokens as \b[\w]+\b)
+WORD_RE = re.compile(r'\w+')
+
+# Vowel classes for stem repair, as sets for C-level membership checks
+VOWELS = frozenset('aeiouyäö')
+BACK_VOWELS = frozenset('aou')
+FRONT_VOWELS = frozenset('äöy')
+DOUBLE_VOWELS = ('aa', 'ää', 'ee', 'ii', 'oo', 'öö', 'uu', 'yy')
+
+# Endings that mark a verb infinitive (for part-of-speech guessing)
+INFINITIVE_ENDINGS = ('da', 'dä', 'ta', 'tä', 'la', 'lä', 'ra', 'rä', 'na', 'nä')
+
+# Finnish case suffixes - order matters! (longer patterns first, plural before singular)
+CASE_PATTERNS = [
+    # Plural forms (check these first, longest suffixes first!)
+    ('partitive', 'plural', ['oja', 'öjä', 'ita', 'itä', 'ia', 'iä']),
+    ('genitive', 'plural', ['iden', 'itten', 'ojen', 'öjen', 'jen', 'ien', 'en']),
+    ('inessive', 'plural', ['issa', 'issä']),
+    ('elative', 'plural', ['ista', 'istä']),
+    ('illative', 'plural', ['isiin', 'ihin', 'oihin', 'öihin']),
+    ('adessive', 'plural', ['oilla', 'öillä', 'illa', 'illä']),
+    ('ablative', 'plural', ['oilta', 'öiltä', 'ilta', 'iltä']),
+    ('allative', 'plural', ['oille', 'öille', 'ille']),
+    ('essive', 'plural', ['oina', 'öinä', 'ina', 'inä']),
+    ('translative', 'plural', ['oiksi', 'öiksi', 'iksi']),
+
+    # Singular forms (longest suffixes first!)
+    ('illative', 'singular', ['seen', 'siin', 'hin', 'hon', 'hön', 'hun', 'hyn']),
+    ('inessive', 'singular', ['ssa', 'ssä']),
+    ('elative', 'singular', ['sta', 'stä']),
+    ('adessive', 'singular', ['lla', 'llä']),
+    ('ablative', 'singular', ['lta', 'ltä']),
+    ('allative', 'singular', ['lle']),
+    ('translative', 'singular', ['ksi']),
+    ('essive', 'singular', ['na', 'nä']),
+    ('partitive', 'singular', ['aa', 'ää', 'ta', 'tä', 'a', 'ä']),
+    # Genitive last for singular (just 'n'), most ambiguous
+    ('genitive', 'singular', ['n']),
+]
+
+# Common verb endings
+VERB_ENDINGS = {
+    'present': ['n', 't', 'mme', 'tte', 'vat', 'vät'],
+    'past': ['in', 'it', 'imme', 'itte', 'ivat', 'ivät'],
+    'conditional': ['isin', 'isit', 'isi', 'isimme', 'isitte', 'isivat', 'isivät'],
+}
+
+# Common Finnish words dictionary (lemma -> forms)
+# Includes different inflection types (sanatyypit) and irregular forms
+KNOWN_WORDS = {
+    # Irregular and exception words
+    'ihminen': [
+        # Type 38: -nen words (ihminen -> ihmise-)
+        'ihminen', 'ihmisen', 'ihmistä', 'ihmisessä', 'ihmisestä', 'ihmiseen',
+        'ihmisellä', 'ihmiseltä', 'ihmiselle', 'ihmisenä', 'ihmiseksi',
+        'ihmiset', 'ihmisten', 'ihmisiä', 'ihmisissä', 'ihmisistä', 'ihmisiin',
+        'ihmisillä', 'ihmisiltä', 'ihmisille', 'ihmisinä', 'ihmisiksi'
+    ],
+    'nainen': [
+        # Type 38: -nen words (nainen -> naise-)
+        'nainen', 'naisen', 'naista', 'naisessa', 'naisesta', 'naiseen',
+        'naisella', 'naiselta', 'naiselle', 'naisena', 'naiseksi',
+        'naiset', 'naisten', 'naisia', 'naisissa', 'naisista', 'naisiin',
+        'naisilla', 'naisilta', 'naisille', 'naisina', 'naisiksi'
+    ],
+    'paras': [
+        # Irregular adjective (paras -> paraa-)
+        'paras', 'parhaan', 'parasta', 'parhaassa', 'parhaasta', 'parhaaseen',
+        'parhaalla', 'parhaalta', 'parhaalle', 'parhaana', 'parhaaksi',
+        'parhaat', 'parhaiden', 'parhaita', 'parhaissa', 'parhaista',
+        'parhaisiin', 'parhailla', 'parhailta', 'parhaille', 'parhaina', 'parhaiksi'
+    ],
+    'hyvä': [
+        # Type 10: -vä/-pä words with gradation
+        'hyvä', 'hyvän', 'hyvää', 'hyvässä', 'hyvästä', 'hyvään',
+        'hyvällä', 'hyvältä', 'hyvälle', 'hyvänä', 'hyväksi',
+        'hyvät', 'hyvien', 'hyviä', 'hyvissä', 'hyvistä', 'hyviin',
+        'hyvillä', 'hyviltä', 'hyville', 'hyvinä', 'hyviksi'
+    ],
+    # Nouns with both singular and plural forms
+    'kissa': [
+        # Singular
+        'kissa', 'kissan', 'kissaa', 'kissassa', 'kissasta', 'kissaan',
+        'kissalla', 'kissalta', 'kissalle', 'kissana', 'kissaksi',
+        # Plural
+        'kissat', 'kissojen', 'kissoja', 'kissoissa', 'kissoista',
+        'kissoihin', 'kissoilla', 'kissoilta', 'kissoille', 'kissoina', 'kissoiksi'
+    ],
+    'koira': [
+        # Singular
+        'koira', 'koiran', 'koiraa', 'koirassa', 'koirasta', 'koiraan',
+        'koiralla', 'koiralta', 'koiralle', 'koirana', 'koiraksi',
+        # Plural
+        'koirat', 'koirien', 'koiria', 'koirissa', 'koirista',
+        'koiriin', 'koirilla', 'koirilta', 'koirille', 'koirina', 'koiriksi'
+    ],
+    'talo': [
+        # Singular
+        'talo', 'talon', 'taloa', 'talossa', 'talosta', 'taloon',
+        'talolla', 'talolta', 'talolle', 'talona', 'taloksi',
+        # Plural
+        'talot', 'talojen', 'taloja', 'taloissa', 'taloista',
+        'taloihin', 'taloilla', 'taloilta', 'taloille', 'taloina', 'taloiksi'
+    ],
+    'auto': [
+        # Singular
+        'auto', 'auton', 'autoa', 'autossa', 'autosta', 'autoon',
+        'autolla', 'autolta', 'autolle', 'autona', 'autoksi',
+        # Plural
+        'autot', 'autojen', 'autoja', 'autoissa', 'autoista',
+        'autoihin', 'autoilla', 'autoilta', 'autoille', 'autoina', 'autoiksi'
+    ],
+    'hiiri': [
+        # Singular
+        'hiiri', 'hiiren', 'hiirtä', 'hiiressä', 'hiirestä', 'hiireen',
+        'hiirellä', 'hiireltä', 'hiirelle', 'hiirenä', 'hiireksi',
+        # Plural
+        'hiiret', 'hiirten', 'hiiriä', 'hiirissä', 'hiiristä',
+        'hiiriin', 'hiirillä', 'hiiriltä', 'hiirille', 'hiirinä', 'hiiriksi'
+    ],
+    'puutarha': ['puutarha', 'puutarhan', 'puutarhaa', 'puutarhassa', 'puutarhasta', 'puutarhaan'],
+
+    # Verbs
+    'syödä': ['syö', 'söi', 'syö', 'söivät', 'syödä'],
+    'juosta': ['juokse', 'juoksi', 'juoksee', 'juoksivat', 'juosta'],
+    'olla': ['on', 'oli', 'ovat', 'olivat', 'olla'],
+
+    # Adjectives
+    'nopea': ['nopea', 'nopean', 'nopeaa', 'nopeasti'],
+    'iso': ['iso', 'ison', 'isoa', 'isossa'],
+    'pieni': ['pieni', 'pienen', 'pientä'],
+}
+
+
+def _build_suffix_index(case_patterns: list) -> Dict[str, List[tuple]]:
+    """
+    Suffix -> [(priority, case, number, suffix)], priority being the position
+    in case_patterns; a word's candidate suffixes are found by probing its
+    last 1-5 characters instead of testing every suffix
+    """
+    suffix_index = {}
+    priority = 0
+    for case, number, suffixes in case_patterns:
+        for suffix in suffixes:
+            suffix_index.setdefault(suffix, []).append((priority, case, number, suffix))
+            priority += 1
+    return suffix_index
+
+
+def _build_form_index(known_words: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Reverse index (form -> lemma) for O(1) lookup; the first lemma listing
+    a form wins, as with the linear search it replaced
+    """
+    form_to_lemma = {}
+    for lemma, forms in known_words.items():
+        for form in forms:
+            form_to_lemma.setdefault(form, lemma)
+    return form_to_lemma
+
+
+def _build_cased_forms(form_to_lemma: Dict[str, str]) -> Dict[str, str]:
+    """
+    Known form as written (lowercase or sentence-initial capitalized) ->
+    lowercase form, so known tokens skip str.lower()
+    """
+    cased_forms = {}
+    for form in form_to_lemma:
+        cased_forms[form] = form
+        cased_forms.setdefault(form.capitalize(), form)
+    return cased_forms
+
+
+def _build_morph_features(case_patterns: list) -> Dict[tuple, Dict[str, str]]:
+    """
+    (case, number) -> morphology dict, one shared read-only dict per
+    combination with interned values, so analyses allocate no dicts
+    """
+    combinations = {('nominative', 'singular'), ('nominative', 'plural')}
+    combinations.update((case, number) for case, number, _ in case_patterns)
+    return {
+        (case, number): {'case': sys.intern(case.capitalize()), 'number': sys.intern(number.capitalize())}
+        for case, number in combinations
+    }
+
+
+# Lookup tables shared (read-only) by every engine instance
+SUFFIX_INDEX = _build_suffix_index(CASE_PATTERNS)
+MAX_SUFFIX_LEN = max(map(len, SUFFIX_INDEX))
+FORM_TO_LEMMA = _build_form_index(KNOWN_WORDS)
+CASED_FORMS = _build_cased_forms(FORM_TO_LEMMA)
+MORPH_FEATURES = _build_morph_features(CASE_PATTERNS)
+
+
 
 class LemmatizerEngine:
     """
@@ -16,51 +212,44 @@ class LemmatizerEngine:
     Uses rule-based patterns for Finnish morphology
     """
 
-    def __init__(self):
-        """Initialize the lemmatizer with Finnish morphological rules"""
+    def __init__(self, word_cache_size: int = 50000):
+        """
+        Initialize the lemmatizer with Finnish morphological rules
+
+        Args:
+            word_cache_size: Distinct (lowercased word, include_morphology) analyses to keep
+        """
         logger.info("Initializing Finnish Lemmatizer Engine")
 
-        # Finnish case suffixes - order matters! (longer patterns first, plural before singular)
-        self.case_patterns = [
-            # Plural forms (check these first, longest suffixes first!)
-            ('partitive', 'plural', ['oja', 'öjä', 'ita', 'itä', 'ia', 'iä']),
-            ('genitive', 'plural', ['iden', 'itten', 'ojen', 'öjen', 'jen', 'ien', 'en']),
-            ('inessive', 'plural', ['issa', 'issä']),
-            ('elative', 'plural', ['ista', 'istä']),
-            ('illative', 'plural', ['isiin', 'ihin', 'oihin', 'öihin']),
-            ('adessive', 'plural', ['oilla', 'öillä', 'illa', 'illä']),
-            ('ablative', 'plural', ['oilta', 'öiltä', 'ilta', 'iltä']),
-            ('allative', 'plural', ['oille', 'öille', 'ille']),
-            ('essive', 'plural', ['oina', 'öinä', 'ina', 'inä']),
-            ('translative', 'plural', ['oiksi', 'öiksi', 'iksi']),
-
-            # Singular forms (longest suffixes first!)
-            ('illative', 'singular', ['seen', 'siin', 'hin', 'hon', 'hön', 'hun', 'hyn']),
-            ('inessive', 'singular', ['ssa', 'ssä']),
-            ('elative', 'singular', ['sta', 'stä']),
-            ('adessive', 'singular', ['lla', 'llä']),
-            ('ablative', 'singular', ['lta', 'ltä']),
-            ('allative', 'singular', ['lle']),
-            ('translative', 'singular', ['ksi']),
-            ('essive', 'singular', ['na', 'nä']),
-            ('partitive', 'singular', ['aa', 'ää', 'ta', 'tä', 'a', 'ä']),
-            # Genitive last for singular (just 'n'), most ambiguous
-            ('genitive', 'singular', ['n']),
-        ]
+        # Finnish case suffixes - order matters! (see CASE_PATTERNS)
+        self.case_patterns = CASE_PATTERNS
+
+        # Suffix lookup tables, built once at import
+        self._suffix_index = SUFFIX_INDEX
+        self._max_suffix_len = MAX_SUFFIX_LEN
 
         # Nominative plural markers
         self.nominative_plural_suffixes = ['t']
 
         # Common verb endings
-        self.verb_endings = {
-            'present': ['n', 't', 'mme', 'tte', 'vat', 'vät'],
-            'past': ['in', 'it', 'imme', 'itte', 'ivat', 'ivät'],
-            'conditional': ['isin', 'isit', 'isi', 'isimme', 'isitte', 'isivat', 'isivät'],
-        }
+        self.verb_endings = VERB_ENDINGS
 
         # Common Finnish words dictionary (lemma -> forms)
         self.known_words = self._load_known_words()
 
+        # Reverse index (form -> lemma), built once at import unless
+        # _load_known_words supplies a different dictionary
+        if self.known_words is KNOWN_WORDS:
+            self._form_to_lemma = FORM_TO_LEMMA
+            self._cased_forms = CASED_FORMS
+        else:
+            self._form_to_lemma = _build_form_index(self.known_words)
+            self._cased_forms = _build_cased_forms(self._form_to_lemma)
+
+        # Word frequencies are Zipfian, so most tokens repeat; cache the
+        # per-word analysis (per instance, keyed by the lowercased word)
+        self._analyze_word_cached = functools.lru_cache(maxsize=word_cache_size)(self._analyze_word)
+
         logger.info("Lemmatizer initialized successfully")
 
     def _load_known_words(self) -> Dict[str, List[str]]:
@@ -69,89 +258,20 @@ class LemmatizerEngine:
         Includes different inflection types (sanatyypit) and irregular forms
         In production, this would load from a comprehensive database
         """
-        return {
-            # Irregular and exception words
-            'ihminen': [
-                # Type 38: -nen words (ihminen -> ihmise-)
-                'ihminen', 'ihmisen', 'ihmistä', 'ihmisessä', 'ihmisestä', 'ihmiseen',
-                'ihmisellä', 'ihmiseltä', 'ihmiselle', 'ihmisenä', 'ihmiseksi',
-                'ihmiset', 'ihmisten', 'ihmisiä', 'ihmisissä', 'ihmisistä', 'ihmisiin',
-                'ihmisillä', 'ihmisiltä', 'ihmisille', 'ihmisinä', 'ihmisiksi'
-            ],
-            'nainen': [
-                # Type 38: -nen words (nainen -> naise-)
-                'nainen', 'naisen', 'naista', 'naisessa', 'naisesta', 'naiseen',
-                'naisella', 'naiselta', 'naiselle', 'naisena', 'naiseksi',
-                'naiset', 'naisten', 'naisia', 'naisissa', 'naisista', 'naisiin',
-                'naisilla', 'naisilta', 'naisille', 'naisina', 'naisiksi'
-            ],
-            'paras': [
-                # Irregular adjective (paras -> paraa-)
-                'paras', 'parhaan', 'parasta', 'parhaassa', 'parhaasta', 'parhaaseen',
-                'parhaalla', 'parhaalta', 'parhaalle', 'parhaana', 'parhaaksi',
-                'parhaat', 'parhaiden', 'parhaita', 'parhaissa', 'parhaista',
-                'parhaisiin', 'parhailla', 'parhailta', 'parhaille', 'parhaina', 'parhaiksi'
-            ],
-            'hyvä': [
-                # Type 10: -vä/-pä words with gradation
-                'hyvä', 'hyvän', 'hyvää', 'hyvässä', 'hyvästä', 'hyvään',
-                'hyvällä', 'hyvältä', 'hyvälle', 'hyvänä', 'hyväksi',
-                'hyvät', 'hyvien', 'hyviä', 'hyvissä', 'hyvistä', 'hyviin',
-                'hyvillä', 'hyviltä', 'hyville', 'hyvinä', 'hyviksi'
-            ],
-            # Nouns with both singular and plural forms
-            'kissa': [
-                # Singular
-                'kissa', 'kissan', 'kissaa', 'kissassa', 'kissasta', 'kissaan',
-                'kissalla', 'kissalta', 'kissalle', 'kissana', 'kissaksi',
-                # Plural
-                'kissat', 'kissojen', 'kissoja', 'kissoissa', 'kissoista',
-                'kissoihin', 'kissoilla', 'kissoilta', 'kissoille', 'kissoina', 'kissoiksi'
-            ],
-            'koira': [
-                # Singular
-                'koira', 'koiran', 'koiraa', 'koirassa', 'koirasta', 'koiraan',
-                'koiralla', 'koiralta', 'koiralle', 'koirana', 'koiraksi',
-                # Plural
-                'koirat', 'koirien', 'koiria', 'koirissa', 'koirista',
-                'koiriin', 'koirilla', 'koirilta', 'koirille', 'koirina', 'koiriksi'
-            ],
-            'talo': [
-                # Singular
-                'talo', 'talon', 'taloa', 'talossa', 'talosta', 'taloon',
-                'talolla', 'talolta', 'talolle', 'talona', 'taloksi',
-                # Plural
-                'talot', 'talojen', 'taloja', 'taloissa', 'taloista',
-                'taloihin', 'taloilla', 'taloilta', 'taloille', 'taloina', 'taloiksi'
-            ],
-            'auto': [
-                # Singular
-                'auto', 'auton', 'autoa', 'autossa', 'autosta', 'autoon',
-                'autolla', 'autolta', 'autolle', 'autona', 'autoksi',
-                # Plural
-                'autot', 'autojen', 'autoja', 'autoissa', 'autoista',
-                'autoihin', 'autoilla', 'autoilta', 'autoille', 'autoina', 'autoiksi'
-            ],
-            'hiiri': [
-                # Singular
-                'hiiri', 'hiiren', 'hiirtä', 'hiiressä', 'hiirestä', 'hiireen',
-                'hiirellä', 'hiireltä', 'hiirelle', 'hiirenä', 'hiireksi',
-                # Plural
-                'hiiret', 'hiirten', 'hiiriä', 'hiirissä', 'hiiristä',
-                'hiiriin', 'hiirillä', 'hiiriltä', 'hiirille', 'hiirinä', 'hiiriksi'
-            ],
-            'puutarha': ['puutarha', 'puutarhan', 'puutarhaa', 'puutarhassa', 'puutarhasta', 'puutarhaan'],
-
-            # Verbs
-            'syödä': ['syö', 'söi', 'syö', 'söivät', 'syödä'],
-            'juosta': ['juokse', 'juoksi', 'juoksee', 'juoksivat', 'juosta'],
-            'olla': ['on', 'oli', 'ovat', 'olivat', 'olla'],
-
-            # Adjectives
-            'nopea': ['nopea', 'nopean', 'nopeaa', 'nopeasti'],
-            'iso': ['iso', 'ison', 'isoa', 'isossa'],
-            'pieni': ['pieni', 'pienen', 'pientä'],
-        }
+        return KNOWN_WORDS
+
+    def _suffix_matches(self, word: str, min_stem: int = 0) -> List[tuple]:
+        """
+        Case suffixes the word ends with, leaving at least min_stem characters
+
+        Returns:
+            List of (priority, case, number, suffix) in case_patterns order
+        """
+        matches = []
+        for length in range(1, min(self._max_suffix_len, len(word) - min_stem) + 1):
+            matches.extend(self._suffix_index.get(word[-length:], ()))
+        matches.sort()
+        return matches
 
     def _identify_pos(self, word: str) -> str:
         """
@@ -163,28 +283,23 @@ class LemmatizerEngine:
             return 'ADV'
 
         # Check for verb infinitive
-        if word.endswith(('da', 'dä', 'ta', 'tä', 'la', 'lä', 'ra', 'rä', 'na', 'nä')):
+        if word.endswith(INFINITIVE_ENDINGS):
             return 'VERB'
 
         # Default to noun
         return 'NOUN'
 
-    def _extract_morphology(self, original: str, lemma: str) -> Dict[str, str]:
+    def _extract_morphology(self, original_lower: str, lemma: str) -> Dict[str, str]:
         """
-        Extract morphological features from the word
+        Extract morphological features from the (already lowercased) word
         Returns case and number (singular/plural)
         Special handling for -nen words (Type 38)
-        """
-        features = {
-            'case': 'Nominative',
-            'number': 'Singular'
-        }
-
-        original_lower = original.lower()
 
+        Returns one of the shared MORPH_FEATURES dicts; treat it as read-only.
+        """
         # If word hasn't changed, it's nominative singular
         if original_lower == lemma:
-            return features
+            return MORPH_FEATURES['nominative', 'singular']
 
         # Special handling for -nen words (Type 38)
         # nainen uses different stems for different cases:
@@ -197,79 +312,69 @@ class LemmatizerEngine:
 
             # Partitive singular: naista = nais + ta (special stem!)
             if original_lower == stem_s + 'ta' or original_lower == stem_s + 'tä':
-                features['case'] = 'Partitive'
-                features['number'] = 'Singular'
-                return features
+                return MORPH_FEATURES['partitive', 'singular']
 
             # Check if original uses the regular 'naise' stem
             if stem_se in original_lower:
                 # Genitive singular: naisen = naise + n
                 if original_lower == stem_se + 'n':
-                    features['case'] = 'Genitive'
-                    features['number'] = 'Singular'
-                    return features
+                    return MORPH_FEATURES['genitive', 'singular']
 
                 # Nominative plural: naiset = naise + t
                 if original_lower == stem_se + 't':
-                    features['case'] = 'Nominative'
-                    features['number'] = 'Plural'
-                    return features
+                    return MORPH_FEATURES['nominative', 'plural']
 
                 # For other cases, match patterns using naise- stem
-                for case, number, suffixes in self.case_patterns:
-                    for suffix in suffixes:
-                        if original_lower == stem_se + suffix:
-                            features['case'] = case.capitalize()
-                            features['number'] = number.capitalize()
-                            return features
+                if original_lower.startswith(stem_se):
+                    entries = self._suffix_index.get(original_lower[len(stem_se):])
+                    if entries:
+                        _, case, number, _ = entries[0]
+                        return MORPH_FEATURES[case, number]
 
         # Check for nominative plural (ends with -t)
         if original_lower.endswith('t') and len(original_lower) > 2:
             # Check if removing 't' gives us the lemma
             if original_lower[:-1] == lemma:
-                features['case'] = 'Nominative'
-                features['number'] = 'Plural'
-                return features
-
-        # Check all case patterns (plural patterns are checked first!)
-        for case, number, suffixes in self.case_patterns:
-            for suffix in suffixes:
-                if original_lower.endswith(suffix):
-                    # Make sure the suffix is significant (word is long enough)
-                    if len(original_lower) > len(suffix) + 1:
-                        features['case'] = case.capitalize()
-                        features['number'] = number.capitalize()
-                        return features
-
-        return features
+                return MORPH_FEATURES['nominative', 'plural']
 
-    def _lemmatize_word(self, word: str, include_morphology: bool = True) -> WordLemma:
-        """
-        Lemmatize a single word
+        # Check all case patterns (plural patterns are checked first!);
+        # the suffix must be significant (at least 2 stem characters left)
+        matches = self._suffix_matches(original_lower, min_stem=2)
+        if matches:
+            _, case, number, _ = matches[0]
+            return MORPH_FEATURES[case, number]
+
+        return MORPH_FEATURES['nominative', 'singular']
+
+    def _analyze_word(self, word_lower: str, include_morphology: bool) -> tuple:
         """
-        # Clean the word
-        original_word = word
-        word_lower = word.lower()
+        Analyze a lowercased word
 
+        Returns:
+            (lemma, pos, morphology)
+        """
         # Check if word is in known words dictionary
-        for lemma, forms in self.known_words.items():
-            if word_lower in forms:
-                morphology = self._extract_morphology(word_lower, lemma) if include_morphology else None
-                pos = self._identify_pos(lemma)
-                return WordLemma(
-                    original=original_word,
-                    lemma=lemma,
-                    pos=pos,
-                    morphology=morphology
-                )
+        lemma = self._form_to_lemma.get(word_lower)
+        if lemma is not None:
+            morphology = self._extract_morphology(word_lower, lemma) if include_morphology else None
+            return lemma, self._identify_pos(lemma), morphology
 
         # Rule-based lemmatization
         lemma = self._rule_based_lemmatize(word_lower)
         morphology = self._extract_morphology(word_lower, lemma) if include_morphology else None
-        pos = self._identify_pos(word_lower)
+        return lemma, self._identify_pos(word_lower), morphology
+
+    def _lemmatize_word(self, word: str, include_morphology: bool = True) -> WordLemma:
+        """
+        Lemmatize a single word
+        """
+        # Known forms as usually written map straight to their lowercase key
+        word_lower = self._cased_forms.get(word) or word.lower()
+        lemma, pos, morphology = self._analyze_word_cached(word_lower, include_morphology)
 
-        return WordLemma(
-            original=original_word,
+        # Fresh result per token so the original casing is kept
+        return WordLemma.model_construct(
+            original=word,
             lemma=lemma,
             pos=pos,
             morphology=morphology
@@ -283,8 +388,10 @@ class LemmatizerEngine:
         - Type 38: -nen words (nainen -> naise- -> nainen)
         - Consonant gradation patterns
         - Vowel harmony
+
+        The word is already lowercased by the caller.
         """
-        lemma = word.lower()
+        lemma = word
 
         # Special handling for -nen words (Type 38)
         # These change stems: nainen -> naise- (most cases) or nais- (partitive sg)
@@ -302,69 +409,68 @@ class LemmatizerEngine:
         if ('ise' in lemma or lemma.endswith('se')) and len(lemma) > 5:
             # Try to reconstruct the -nen form
             # naisessa -> remove suffix -> naise -> remove 'se' -> nai -> add 'nen' -> nainen
-            for case, number, suffixes in self.case_patterns:
-                for suffix in suffixes:
-                    if lemma.endswith(suffix):
-                        stem = lemma[:-len(suffix)]
-                        # Check if stem ends with 'ise' or just 'se'
-                        if stem.endswith('ise'):
-                            # Remove 'ise' and add 'inen'
-                            base = stem[:-3]
-                            return base + 'nen'
-                        elif stem.endswith('se'):
-                            # Remove 'se' and add 'nen'
-                            base = stem[:-2]
-                            return base + 'nen'
+            for _, case, number, suffix in self._suffix_matches(lemma):
+                stem = lemma[:-len(suffix)]
+                # Check if stem ends with 'ise' or just 'se'
+                if stem.endswith('ise'):
+                    # Remove 'ise' and add 'inen'
+                    base = stem[:-3]
+                    return base + 'nen'
+                elif stem.endswith('se'):
+                    # Remove 'se' and add 'nen'
+                    base = stem[:-2]
+                    return base + 'nen'
 
         # First, check for nominative plural (ends with -t)
         if lemma.endswith('t') and len(lemma) > 3:
             # Remove the -t
             lemma = lemma[:-1]
             # Handle double vowels (talot -> talo, not talot -> talo)
-            if lemma.endswith(('aa', 'ää', 'ee', 'ii', 'oo', 'öö', 'uu', 'yy')):
+            if lemma.endswith(DOUBLE_VOWELS):
                 lemma = lemma[:-1]
             return lemma
 
-        # Try to match and remove case endings (check plural forms first!)
-        for case, number, suffixes in self.case_patterns:
-            for suffix in suffixes:
-                if lemma.endswith(suffix) and len(lemma) > len(suffix) + 2:
-                    # Remove the suffix
-                    stem = lemma[:-len(suffix)]
-
-                    # Handle plural stem with 'i' or 'j' marker
-                    if number == 'plural':
-                        # Remove plural 'i' if present before removed suffix
-                        if stem.endswith('i') and len(stem) > 2:
-                            # Only remove if preceded by consonant (kissoi -> kisso -> kissa)
-                            if stem[-2] not in 'aeiouyäö':
-                                stem = stem[:-1]
-
-                        # Remove 'j' plural marker (kissoj -> kisso)
-                        if stem.endswith('j') and len(stem) > 2:
-                            stem = stem[:-1]
-
-                        # Remove 'o'/'ö' if it was added for plural stem (kisso -> kissa)
-                        if len(stem) > 2 and stem.endswith('o') and stem[-2] not in 'o':
-                            # Check vowel harmony
-                            has_back = any(v in stem for v in 'aou')
-                            has_front = any(v in stem for v in 'äöy')
-                            if has_front and not has_back:
-                                # Should be 'ö', try replacing o with nothing or original
-                                stem = stem[:-1] + 'a'
-                            elif has_back:
-                                stem = stem[:-1] + 'a'
-                        elif len(stem) > 2 and stem.endswith('ö') and stem[-2] not in 'ö':
-                            stem = stem[:-1] + 'ä'
-
-                    # Handle double vowels that appear due to stem changes
-                    if stem.endswith(('aa', 'ää', 'ee', 'ii', 'oo', 'öö', 'uu', 'yy')):
+        # Try to match and remove case endings (check plural forms first!),
+        # keeping at least 3 stem characters
+        matches = self._suffix_matches(lemma, min_stem=3)
+        if matches:
+            _, case, number, suffix = matches[0]
+            # Remove the suffix
+            stem = lemma[:-len(suffix)]
+
+            # Handle plural stem with 'i' or 'j' marker
+            if number == 'plural':
+                # Remove plural 'i' if present before removed suffix
+                if stem.endswith('i') and len(stem) > 2:
+                    # Only remove if preceded by consonant (kissoi -> kisso -> kissa)
+                    if stem[-2] not in VOWELS:
                         stem = stem[:-1]
 
-                    # Handle single partitive vowel addition (talo+a -> talo)
-                    # Already handled by not having the vowel
+                # Remove 'j' plural marker (kissoj -> kisso)
+                if stem.endswith('j') and len(stem) > 2:
+                    stem = stem[:-1]
+
+                # Remove 'o'/'ö' if it was added for plural stem (kisso -> kissa)
+                if len(stem) > 2 and stem.endswith('o') and stem[-2] not in 'o':
+                    # Check vowel harmony
+                    has_back = not BACK_VOWELS.isdisjoint(stem)
+                    has_front = not FRONT_VOWELS.isdisjoint(stem)
+                    if has_front and not has_back:
+                        # Should be 'ö', try replacing o with nothing or original
+                        stem = stem[:-1] + 'a'
+                    elif has_back:
+                        stem = stem[:-1] + 'a'
+                elif len(stem) > 2 and stem.endswith('ö') and stem[-2] not in 'ö':
+                    stem = stem[:-1] + 'ä'
+
+            # Handle double vowels that appear due to stem changes
+            if stem.endswith(DOUBLE_VOWELS):
+                stem = stem[:-1]
+
+            # Handle single partitive vowel addition (talo+a -> talo)
+            # Already handled by not having the vowel
 
-                    return stem
+            return stem
 
         # If no pattern matched, return as is
         return lemma
@@ -374,8 +480,7 @@ class LemmatizerEngine:
         Simple tokenization for Finnish text
         """
         # Split on whitespace and punctuation, but keep words
-        tokens = re.findall(r'\b[\w]+\b', text)
-        return tokens
+        return WORD_RE.findall(text)
 
     def lemmatize(self, text: str, include_morphology: bool = True) -> LemmatizationResponse:
         """
@@ -393,14 +498,18 @@ class LemmatizerEngine:
         # Tokenize
         tokens = self._tokenize(text)
 
-        # Lemmatize each word
+        # Build one WordLemma per distinct token in the request and reuse it
+        # for repeats (results are read-only); analyses come from the
+        # per-word cache keyed by the lowercased word
+        by_token = {}
         lemmas = []
         for token in tokens:
-            if token.strip():
-                word_lemma = self._lemmatize_word(token, include_morphology)
-                lemmas.append(word_lemma)
+            word_lemma = by_token.get(token)
+            if word_lemma is None:
+                word_lemma = by_token[token] = self._lemmatize_word(token, include_morphology)
+            lemmas.append(word_lemma)
 
-        result = LemmatizationResponse(
+        result = LemmatizationResponse.model_construct(
             text=text,
             lemmas=lemmas,
             word_count=len(lemmas)
@@ -4,11 +4,50 @@ Detects profanity and toxic content in Finnish text
 """
 import re
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.models.schemas import ProfanityResponse, FlaggedWord
+from app.utils.keyword_matcher import PrefixKeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Finnish profanity words (sample list - in production use comprehensive dataset)
+# Note: These are example words for demonstration
+PROFANITY_WORDS = {
+    # Mild profanity (score: 0.3-0.5)
+    'perkele': 0.5,
+    'helvetti': 0.4,
+    'saatana': 0.5,
+    'jumalauta': 0.4,
+    'hitto': 0.3,
+    'pahus': 0.2,
+
+    # Strong profanity (score: 0.6-0.8)
+    'vittu': 0.8,
+    'paska': 0.6,
+    'kusipää': 0.7,
+    'idiootti': 0.6,
+    'tyhmä': 0.4,
+
+    # Toxic patterns (score: 0.7-0.9)
+    'vihaan': 0.7,
+    'tapan': 0.9,
+    'kuole': 0.8,
+}
+
+# Toxic phrase patterns
+TOXIC_PATTERNS = [
+    r'ole\w*\s+tyhmä',
+    r'vihaan\s+sinua',
+    r'kuole\w*',
+    r'tapan\s+sinut',
+]
+
+# Matchers built once at import and shared (read-only) by every detector:
+# profanity words including morphological variants (any word that starts
+# with a profanity word), and each toxic phrase pattern
+PROFANITY_MATCHER = PrefixKeywordMatcher(PROFANITY_WORDS)
+TOXIC_RES = [re.compile(pattern) for pattern in TOXIC_PATTERNS]
+
 
 class ProfanityDetector:
     """
@@ -20,86 +59,40 @@ class ProfanityDetector:
         """Initialize profanity detector"""
         logger.info("Initializing Profanity Detection Model")
 
-        # Finnish profanity words (sample list - in production use comprehensive dataset)
-        # Note: These are example words for demonstration
-        self.profanity_words = {
-            # Mild profanity (score: 0.3-0.5)
-            'perkele': 0.5,
-            'helvetti': 0.4,
-            'saatana': 0.5,
-            'jumalauta': 0.4,
-            'hitto': 0.3,
-            'pahus': 0.2,
-
-            # Strong profanity (score: 0.6-0.8)
-            'vittu': 0.8,
-            'paska': 0.6,
-            'kusipää': 0.7,
-            'idiootti': 0.6,
-            'tyhmä': 0.4,
-
-            # Toxic patterns (score: 0.7-0.9)
-            'vihaan': 0.7,
-            'tapan': 0.9,
-            'kuole': 0.8,
-        }
+        self.profanity_words = PROFANITY_WORDS
 
         # Profanity word variants (with common morphological forms)
-        self.profanity_patterns = self._build_profanity_patterns()
+        self.profanity_patterns = PROFANITY_MATCHER
 
         # Toxic phrase patterns
-        self.toxic_patterns = [
-            r'ole\w*\s+tyhmä',
-            r'vihaan\s+sinua',
-            r'kuole\w*',
-            r'tapan\s+sinut',
-        ]
+        self.toxic_patterns = TOXIC_PATTERNS
+        self.toxic_res = TOXIC_RES
 
         logger.info(f"Loaded {len(self.profanity_words)} profanity words")
         logger.info("Profanity detector initialized successfully")
 
-    def _build_profanity_patterns(self) -> dict:
-        """
-        Build regex patterns for profanity words including morphological variants
-        """
-        patterns = {}
-
-        for word, severity in self.profanity_words.items():
-            # Create pattern that matches the word with common endings
-            pattern = rf'\b{word}\w*\b'
-            patterns[pattern] = severity
-
-        return patterns
-
-    def _find_profanity_words(self, text: str) -> List[tuple]:
+    def _find_profanity_words(self, text: str) -> Tuple[List[tuple], int]:
         """
         Find profanity words in text
-        Returns list of (word, position, confidence)
+        Returns (list of (word, position, confidence), word count)
         """
-        findings = []
         text_lower = text.lower()
 
-        # Check each profanity pattern
-        for pattern, severity in self.profanity_patterns.items():
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                findings.append((
-                    match.group(),
-                    match.start(),
-                    severity
-                ))
+        # Words starting with a profanity keyword (covers morphological variants);
+        # the same pass counts words for the density factor
+        findings, word_count = self.profanity_patterns.scan(text_lower)
 
-        # Check toxic phrases
-        for pattern in self.toxic_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
+        # Check toxic phrases (one scan per pattern, so overlapping phrases
+        # such as 'kuole' and 'ole tyhmä' are both found)
+        for pattern in self.toxic_res:
+            for match in pattern.finditer(text_lower):
                 findings.append((
                     match.group(),
                     match.start(),
                     0.8  # High severity for toxic phrases
                 ))
 
-        return findings
+        return findings, word_count
 
     def _calculate_toxicity_score(self, findings: List[tuple], word_count: int) -> float:
         """
@@ -149,14 +142,11 @@ class ProfanityDetector:
         Returns:
             ProfanityResponse with toxicity analysis
         """
-        logger.info(f"Checking profanity for text: {text[:50]}...")
-
-        # Find profanity
-        findings = self._find_profanity_words(text)
+        # Lazy %-style arguments: nothing is formatted unless INFO is enabled
+        logger.info("Checking profanity for text: %.50s...", text)
 
-        # Calculate word count
-        words = re.findall(r'\b[\w]+\b', text)
-        word_count = len(words)
+        # Find profanity and count words
+        findings, word_count = self._find_profanity_words(text)
 
         # Calculate toxicity score
         toxicity_score = self._calculate_toxicity_score(findings, word_count)
@@ -171,7 +161,7 @@ class ProfanityDetector:
         flagged_words = None
         if return_flagged_words and findings:
             flagged_words = [
-                FlaggedWord(
+                FlaggedWord.model_construct(
                     word=word,
                     position=position,
                     confidence=confidence
@@ -179,7 +169,7 @@ class ProfanityDetector:
                 for word, position, confidence in findings
             ]
 
-        result = ProfanityResponse(
+        result = ProfanityResponse.model_construct(
             text=text,
             is_toxic=is_toxic,
             toxicity_score=toxicity_score,
@@ -187,5 +177,5 @@ class ProfanityDetector:
             severity=severity
         )
 
-        logger.info(f"Profanity check complete: {severity} severity ({toxicity_score} score)")
+        logger.info("Profanity check complete: %s severity (%s score)", severity, toxicity_score)
         return result
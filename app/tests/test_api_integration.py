@@ -2,7 +2,9 @@
 Integration tests for API endpoints
 Tests the full API functionality end-to-end
 """
+import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -10,10 +12,14 @@ from app.main import app
 class TestAPIIntegration:
     """Integration tests for all API endpoints"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """Create test client"""
-        return TestClient(app)
+        """
+        Create one test client for the class (the context manager runs the
+        startup lifespan once, and shutdown after the last test)
+        """
+        with TestClient(app) as client:
+            yield client
 
     # System Endpoints Tests
     def test_health_check(self, client):
@@ -181,6 +187,183 @@ class TestAPIIntegration:
         data = response.json()
         assert data["severity"] in ["None", "Low", "Medium", "High"]
 
+    # Batch Endpoint Tests
+    def test_batch_lemmatize_preserves_order(self, client):
+        """Test batch lemmatization returns results in input order"""
+        texts = ["kissa juoksee", "talossa", "koira söi hiiren"]
+        response = client.post("/api/batch/lemmatize", json={"texts": texts})
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["text"] for r in data["results"]] == texts
+        assert data["total_texts"] == 3
+        assert data["total_words"] == 6
+
+    def test_batch_complexity(self, client):
+        """Test batch complexity analysis aggregates scores"""
+        texts = ["Kissa juoksee.", "Kissa, joka söi hiiren, juoksi nopeasti."]
+        response = client.post("/api/batch/complexity", json={"texts": texts})
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["text"] for r in data["results"]] == texts
+        scores = [r["morphological_depth_score"] for r in data["results"]]
+        assert data["average_complexity_score"] == round(sum(scores) / len(scores), 2)
+
+    def test_batch_profanity(self, client):
+        """Test batch profanity detection counts toxic texts"""
+        texts = ["Hei maailma", "vittu", "Tämä on testi"]
+        response = client.post("/api/batch/swear-check", json={"texts": texts})
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["is_toxic"] for r in data["results"]] == [False, True, False]
+        assert data["toxic_count"] == 1
+
+    def test_batch_duplicate_texts(self, client):
+        """Test duplicate texts in a batch each get a result"""
+        texts = ["vittu", "Hei maailma", "vittu"]
+        response = client.post("/api/batch/swear-check", json={"texts": texts})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_texts"] == 3
+        assert [r["text"] for r in data["results"]] == texts
+        assert data["toxic_count"] == 2
+
+    def test_batch_stream(self, client):
+        """Test streamed batch returns one NDJSON line per text plus a summary"""
+        texts = ["vittu", "Hei maailma", "vittu"]
+        response = client.post("/api/batch/swear-check/stream", json={"texts": texts})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        items = sorted(lines[:-1], key=lambda line: line["index"])
+        assert [item["result"]["text"] for item in items] == texts
+        assert lines[-1]["summary"]["total_texts"] == 3
+        assert lines[-1]["summary"]["toxic_count"] == 2
+
+    def test_batch_stream_reports_failures_separately(self, client):
+        """Test a failed text is reported as failed and left out of the averages"""
+        from app.config import Settings, get_settings
+        from app.engines import get_complexity_analyzer
+        from app.services.complexity_engine import ComplexityEngine
+        analyzer = ComplexityEngine()
+
+        class FailingAnalyzer:
+            def analyze(self, text, **kwargs):
+                if text == "rikki":
+                    raise ValueError("broken text")
+                return analyzer.analyze(text, **kwargs)
+
+        app.dependency_overrides[get_complexity_analyzer] = FailingAnalyzer
+        app.dependency_overrides[get_settings] = lambda: Settings(BATCH_EXECUTOR="thread")
+        try:
+            response = client.post("/api/batch/complexity/stream", json={"texts": ["Kissa juoksee.", "rikki"]})
+        finally:
+            app.dependency_overrides.clear()
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        summary = lines[-1]["summary"]
+        assert [line["error"] for line in lines[:-1] if "error" in line] == ["broken text"]
+        assert summary["failed"] == 1
+        assert summary["total_texts"] == 1
+        score = analyzer.analyze("Kissa juoksee.").morphological_depth_score
+        assert summary["average_complexity_score"] == round(score, 2)
+
+    def test_batch_stream_releases_slot_before_read(self):
+        """Test a streamed batch frees its slot once computed, not once read"""
+        import asyncio
+        from app.config import Settings
+        from app.routers import batch_processing
+        from app.services.complexity_engine import ComplexityEngine
+
+        async def scenario():
+            free = batch_processing._BATCH_SLOTS._value
+            response = batch_processing._stream_batch(
+                ComplexityEngine(), "analyze", ["Kissa juoksee.", "Koira haukkuu."],
+                batch_processing._accumulate_complexity, batch_processing._summarize_complexity,
+                settings=Settings(BATCH_EXECUTOR="thread")
+            )
+            body = response.body_iterator
+            await body.__anext__()
+            await asyncio.sleep(0.1)  # the other item finishes, nobody reads it
+            try:
+                return free, batch_processing._BATCH_SLOTS._value
+            finally:
+                await body.aclose()
+
+        before, while_unread = asyncio.run(scenario())
+        assert while_unread == before
+
+    def test_batch_stream_cancellation(self, monkeypatch):
+        """Test cancelled items become error lines and a closed stream cancels the rest"""
+        import asyncio
+        from app.config import Settings
+        from app.routers import batch_processing
+        from app.services.complexity_engine import ComplexityEngine
+        engine = ComplexityEngine()
+        dispatched = []
+
+        def fake_dispatch(engine, method, texts, settings, **kwargs):
+            loop = asyncio.get_running_loop()
+            finished, cancelled, stuck = (loop.create_future() for _ in range(3))
+            finished.set_result(engine.analyze(texts[0]))
+            cancelled.cancel()  # as after shutdown_batch_executors()
+            dispatched[:] = [finished, cancelled, stuck]
+            return dispatched if len(texts) == 3 else dispatched[:2]
+
+        monkeypatch.setattr(batch_processing, "_dispatch", fake_dispatch)
+
+        def stream(texts):
+            return batch_processing._stream_batch(
+                engine, "analyze", texts,
+                batch_processing._accumulate_complexity, batch_processing._summarize_complexity,
+                settings=Settings(BATCH_EXECUTOR="thread")
+            ).body_iterator
+
+        async def read_all():
+            return [json.loads(line) async for line in stream(["a", "b"])]
+
+        async def read_one_and_close():
+            body = stream(["a", "b", "c"])
+            await body.__anext__()
+            await body.aclose()
+            return dispatched[2].cancelled()
+
+        lines = asyncio.run(read_all())
+        assert {"index": 1, "error": "cancelled"} in lines
+        assert lines[-1]["summary"]["failed"] == 1
+        assert asyncio.run(read_one_and_close())
+
+    def test_batch_settings_override(self, client):
+        """Test batch endpoints read settings through the overridable dependency"""
+        from app.config import Settings, get_settings
+        assert get_settings() is get_settings()
+        app.dependency_overrides[get_settings] = lambda: Settings(BATCH_EXECUTOR="thread")
+        try:
+            response = client.post("/api/batch/lemmatize", json={"texts": ["kissa"]})
+        finally:
+            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        assert response.json()["total_texts"] == 1
+
+    def test_batch_process_pool(self, client):
+        """Test a batch runs in spawned worker processes with their own engines"""
+        from app.config import Settings, get_settings
+        from app.routers import batch_processing
+        app.dependency_overrides[get_settings] = lambda: Settings(BATCH_EXECUTOR="process", BATCH_WORKERS=1)
+        try:
+            response = client.post("/api/batch/lemmatize", json={"texts": ["kissa juoksee", "talossa"]})
+        finally:
+            app.dependency_overrides.clear()
+            batch_processing.shutdown_batch_executors()
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["text"] for r in data["results"]] == ["kissa juoksee", "talossa"]
+        assert data["total_words"] == 3
+        assert batch_processing._worker_engines == {}
+
+    def test_batch_empty_list(self, client):
+        """Test batch request with no texts should fail validation"""
+        response = client.post("/api/batch/lemmatize", json={"texts": []})
+        assert response.status_code == 422
+
     # Cross-functionality Tests
     def test_all_endpoints_with_same_text(self, client):
         """Test all endpoints with the same text"""
@@ -227,14 +410,44 @@ class TestAPIIntegration:
             "talo"
         ]
 
-        responses = []
-        for text in texts:
-            response = client.get(f"/api/lemmatize?text={text}")
-            responses.append(response)
+        # Issue the requests from several threads so they overlap in the app
+        with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+            responses = list(pool.map(lambda text: client.get(f"/api/lemmatize?text={text}"), texts))
 
         # All should succeed
         assert all(r.status_code == 200 for r in responses)
 
+    def test_get_not_modified(self, client):
+        """Test that a GET repeated with its ETag returns an empty 304"""
+        response = client.get("/api/lemmatize?text=kissa")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached = client.get("/api/lemmatize?text=kissa", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        changed = client.get("/api/lemmatize?text=koira", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_log_records_enqueued_unformatted(self):
+        """Test the queue handler leaves traceback formatting to the listener"""
+        import logging
+        import queue
+        import sys
+        from app.main import _DeferredQueueHandler
+        log_queue = queue.SimpleQueue()
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            record = logging.makeLogRecord({"msg": "boom", "exc_info": sys.exc_info()})
+        _DeferredQueueHandler(log_queue).handle(record)
+        queued = log_queue.get_nowait()
+        assert queued.exc_info is not None
+        assert queued.exc_text is None
+
     def test_api_documentation(self, client):
         """Test that API documentation is accessible"""
         response = client.get("/docs")
@@ -0,0 +1,64 @@
+"""
+Unit tests for MicroBatcher
+"""
+import asyncio
+import pytest
+from app.utils.batching import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher"""
+
+    def test_concurrent_items_share_one_call(self):
+        """Test that items submitted together are processed in one batch call"""
+        calls = []
+
+        def double_all(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        async def scenario():
+            batcher = MicroBatcher(double_all, max_batch_size=8, max_delay=0.05)
+            batcher.start()
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(scenario()) == [0, 2, 4, 6, 8]
+        assert calls == [[0, 1, 2, 3, 4]]
+
+    def test_batch_size_is_bounded(self):
+        """Test that no batch exceeds max_batch_size"""
+        sizes = []
+
+        def identity(items):
+            sizes.append(len(items))
+            return items
+
+        async def scenario():
+            batcher = MicroBatcher(identity, max_batch_size=2, max_delay=0.05)
+            batcher.start()
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+        assert max(sizes) <= 2
+
+    def test_failure_propagates_to_callers(self):
+        """Test that an exception in the batch function reaches every waiter"""
+        def fail(items):
+            raise ValueError("model unavailable")
+
+        async def scenario():
+            batcher = MicroBatcher(fail, max_delay=0.01)
+            batcher.start()
+            try:
+                await batcher.submit("text")
+            finally:
+                await batcher.stop()
+
+        with pytest.raises(ValueError):
+            asyncio.run(scenario())
@@ -0,0 +1,144 @@
+"""
+Unit tests for NLPCache
+"""
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from app.utils import cache as cache_module
+from app.utils.cache import NLPCache, cached_result
+
+
+class TestNLPCache:
+    """Test cases for the in-memory cache tier"""
+
+    @pytest.fixture
+    def cache(self):
+        """Create in-memory cache"""
+        return NLPCache(max_entries=2)
+
+    def test_get_after_set(self, cache):
+        """Test that a stored result is returned for the same text and params"""
+        cache.set('lemma', 'kissa', {'lemma': 'kissa'}, {'include_morphology': True})
+        assert cache.get('lemma', 'kissa', {'include_morphology': True}) == {'lemma': 'kissa'}
+        assert cache.get('lemma', 'kissa', {'include_morphology': False}) is None
+
+    def test_least_recently_used_is_evicted(self, cache):
+        """Test that the least recently used entry is dropped at capacity"""
+        cache.set('lemma', 'a', 1)
+        cache.set('lemma', 'b', 2)
+        cache.get('lemma', 'a')
+        cache.set('lemma', 'c', 3)
+        assert cache.get('lemma', 'a') == 1
+        assert cache.get('lemma', 'b') is None
+        assert cache.get('lemma', 'c') == 3
+
+    def test_expired_entries_miss(self):
+        """Test that entries past their TTL are not returned"""
+        cache = NLPCache(ttl=0)
+        cache.set('lemma', 'kissa', 1)
+        assert cache.get('lemma', 'kissa') is None
+
+    def test_clear_prefix(self, cache):
+        """Test that clearing a prefix keeps other prefixes"""
+        cache.set('lemma', 'kissa', 1)
+        cache.set('complexity', 'kissa', 2)
+        cache.clear('lemma')
+        assert cache.get('lemma', 'kissa') is None
+        assert cache.get('complexity', 'kissa') == 2
+
+    def test_get_many_matches_get(self):
+        """Test that batch lookups return results in input order, None for misses"""
+        cache = NLPCache()
+        cache.set_many('lemma', ['kissa', 'koira'], [1, 2], {'include_morphology': True})
+        results = cache.get_many('lemma', ['koira', 'talo', 'kissa'], {'include_morphology': True})
+        assert results == [2, None, 1]
+        assert cache.get('lemma', 'kissa', {'include_morphology': True}) == 1
+
+    def test_cached_result_keys_on_argument_names(self, monkeypatch):
+        """Test that positional and keyword calls share one cache entry"""
+        monkeypatch.setattr(cache_module, '_cache_instance', NLPCache())
+        calls = []
+
+        @cached_result('repeat', min_len=0)
+        def repeat(text, times=1):
+            calls.append(times)
+            return text * times
+
+        assert repeat('ab', 2) == 'abab'
+        assert repeat('ab', times=2) == 'abab'
+        assert calls == [2]
+
+    def test_cached_result_applies_defaults(self, monkeypatch):
+        """Test that omitted, positional and keyword defaults share one entry"""
+        monkeypatch.setattr(cache_module, '_cache_instance', NLPCache())
+        calls = []
+
+        @cached_result('upper', min_len=0)
+        def upper(text, flag=True):
+            calls.append(flag)
+            return text.upper()
+
+        assert upper('kissa') == upper('kissa', True) == upper('kissa', flag=True) == 'KISSA'
+        assert upper('kissa', flag=False) == 'KISSA'
+        assert calls == [True, False]
+
+    def test_cached_result_caches_none(self, monkeypatch):
+        """Test that a None result is served from the cache, not recomputed"""
+        monkeypatch.setattr(cache_module, '_cache_instance', NLPCache())
+        calls = []
+
+        @cached_result('lookup', min_len=0)
+        def lookup(text):
+            calls.append(text)
+            return None
+
+        assert lookup('kissa') is None
+        assert lookup('kissa') is None
+        assert calls == ['kissa']
+
+    def test_cached_result_skips_short_texts(self, monkeypatch):
+        """Test that texts below min_len are always recomputed"""
+        monkeypatch.setattr(cache_module, '_cache_instance', NLPCache())
+        calls = []
+
+        @cached_result('upper', min_len=4)
+        def upper(text):
+            calls.append(text)
+            return text.upper()
+
+        assert [upper('abc'), upper('abc'), upper('abcd'), upper('abcd')] == ['ABC', 'ABC', 'ABCD', 'ABCD']
+        assert calls == ['abc', 'abc', 'abcd']
+
+    def test_redis_encoding_round_trips(self):
+        """Test that small and compressed large values decode unchanged"""
+        small = {'lemma': 'kissa'}
+        large = {'lemmas': [{'original': 'kissan', 'lemma': 'kissa'}] * 100}
+        assert NLPCache._decode(NLPCache._encode(small)) == small
+        assert NLPCache._encode(large).startswith(b"z")
+        assert NLPCache._decode(NLPCache._encode(large)) == large
+
+    def test_cached_result_computes_concurrent_misses_once(self, monkeypatch):
+        """Test that concurrent calls with the same input share one computation"""
+        monkeypatch.setattr(cache_module, '_cache_instance', NLPCache())
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        @cached_result('slow', min_len=0)
+        def slow(text):
+            calls.append(text)
+            started.set()
+            release.wait(5)
+            return text.upper()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(slow, 'kissa')
+            started.wait(5)
+            others = [pool.submit(slow, 'kissa') for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [first.result()] + [other.result() for other in others]
+
+        assert results == ['KISSA'] * 4
+        assert calls == ['kissa']
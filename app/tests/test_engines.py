@@ -0,0 +1,34 @@
+"""
+Unit tests for shared engine loading
+"""
+import asyncio
+from fastapi import FastAPI
+from app import engines
+
+
+class TestEngines:
+    """Test cases for lazy engine construction"""
+
+    def test_engine_built_on_first_use(self):
+        """Test that an engine is built on demand and stored on app.state"""
+        app = FastAPI()
+        engine = asyncio.run(engines.ensure_engine(app, "lemmatizer"))
+        assert engine is app.state.lemmatizer
+
+    def test_concurrent_first_use_builds_once(self, monkeypatch):
+        """Test that concurrent first requests share one build"""
+        calls = []
+
+        def load():
+            calls.append(1)
+            return object()
+
+        monkeypatch.setitem(engines.ENGINE_LOADERS, "lemmatizer", load)
+        app = FastAPI()
+
+        async def scenario():
+            return await asyncio.gather(*(engines.ensure_engine(app, "lemmatizer") for _ in range(5)))
+
+        results = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
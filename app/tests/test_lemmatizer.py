@@ -83,3 +83,16 @@ class TestLemmatizerEngine:
             result = lemmatizer.lemmatize(word)
             # Should recognize it as some form of 'talo'
             assert result.word_count == 1
+
+    def test_word_cache_keeps_original_casing(self, lemmatizer):
+        """Test that repeated words share an analysis but keep their own casing"""
+        result = lemmatizer.lemmatize("Talossa talossa TALOSSA")
+        assert [lemma.original for lemma in result.lemmas] == ["Talossa", "talossa", "TALOSSA"]
+        assert len({lemma.lemma for lemma in result.lemmas}) == 1
+        assert lemmatizer._analyze_word_cached.cache_info().hits == 2
+
+    def test_repeated_tokens_share_result(self, lemmatizer):
+        """Test that identical tokens in one request reuse the same result"""
+        result = lemmatizer.lemmatize("ja kissa ja koira ja")
+        assert result.word_count == 5
+        assert result.lemmas[0] is result.lemmas[2] is result.lemmas[4]
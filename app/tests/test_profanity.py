@@ -137,3 +137,47 @@ class TestProfanityDetector:
         assert hasattr(result, 'toxicity_score')
         assert hasattr(result, 'severity')
         assert result.text == "testi"
+
+    def test_keyword_matcher_matches_regex_semantics(self, detector):
+        """Test the prefix matcher finds the same words as per-keyword regexes"""
+        import re
+        text = "paskapuhetta, vittuilu ja kuolemaan! pahusta ei tapana"
+        expected = sorted(
+            (match.group(), match.start(), severity)
+            for word, severity in detector.profanity_words.items()
+            for match in re.finditer(rf'\b{word}\w*\b', text)
+        )
+        assert sorted(detector.profanity_patterns.find(text)) == expected
+
+    def test_advanced_prefilter_matches_full_scan(self):
+        """Test the advanced detector's substring prefilter never hides a finding"""
+        from app.services.advanced_profanity_model import AdvancedProfanityDetector
+        advanced = AdvancedProfanityDetector(use_transformers=False)
+        texts = [
+            "Hyvää huomenta, mitä kuuluu?",
+            "Olet niin tyhmä",
+            "Ole hiljaa nyt",
+            "Tämä on paskapuhetta",
+            "Vihaan sinua",
+        ]
+        filtered = [advanced._detect_with_keywords(text) for text in texts]
+        advanced._trigger_substrings = ('',)  # every text passes the prefilter
+        assert filtered == [advanced._detect_with_keywords(text) for text in texts]
+        assert filtered[0] == (0.0, [])
+
+    def test_overlapping_toxic_phrases(self, detector):
+        """Test that a toxic phrase overlapping another one is still found"""
+        from app.services.advanced_profanity_model import AdvancedProfanityDetector
+        advanced = AdvancedProfanityDetector(use_transformers=False)
+        findings, _ = detector._find_profanity_words("Kuole tyhmä!")
+        assert ('ole tyhmä', 2, 0.8) in findings
+        _, findings = advanced._detect_with_keywords("Kuole tyhmä!")
+        assert ('ole tyhmä', 2, 0.8) in findings
+
+    def test_advanced_prefilter_literals_from_patterns(self):
+        """Test prefilter literals come from the toxic patterns, or fail loudly"""
+        from app.services.advanced_profanity_model import _required_literal
+        assert _required_literal(r'ole\w*\s+hiljaa') == 'hiljaa'
+        assert _required_literal(r'kuole\w*') == 'kuole'
+        with pytest.raises(ValueError):
+            _required_literal(r'(kuole|tapan)')
@@ -0,0 +1,110 @@
+"""
+Micro-batching utility
+Coalesces concurrent single-item calls into one batch call
+"""
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Collects items submitted within a short window and processes them together
+
+    Useful when the underlying model has a per-call overhead (e.g. a transformer
+    forward pass) that can be shared by several requests.
+    """
+
+    def __init__(
+        self,
+        batch_func: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 16,
+        max_delay: float = 0.02
+    ):
+        """
+        Initialize batcher
+
+        Args:
+            batch_func: Blocking function mapping a list of items to a list of results
+            max_batch_size: Maximum number of items per batch call
+            max_delay: Seconds to wait for more items after the first one arrives
+        """
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background worker is accepting items"""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        """Start the background worker on the running event loop"""
+        if not self.is_running:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background worker"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit one item and wait for its result
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result produced by batch_func for this item
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect_batch(self) -> list:
+        """Wait for the first item, then gather more until the batch is full or the window closes"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_delay
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        """Worker loop: process collected batches in the default executor"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            items = [item for item, _ in batch]
+
+            try:
+                results = await loop.run_in_executor(None, self.batch_func, items)
+            except Exception as e:
+                logger.error(f"Micro-batch of {len(items)} items failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -3,22 +3,61 @@ Caching utility for NLP results
 Supports in-memory cache with optional Redis backend
 """
 import hashlib
-import json
+import inspect
 import logging
-from typing import Optional, Any
-from functools import lru_cache
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Any, Dict, List
+from functools import lru_cache, partial, wraps
 from datetime import datetime, timedelta
+import orjson
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Hash for cache keys. Keys need no cryptographic strength; SHA-1 is
+# hardware-accelerated in OpenSSL and ~3x faster than MD5 on long texts.
+# Swappable (any hashlib-style constructor) e.g. in tests.
+DEFAULT_HASHER = partial(hashlib.sha1, usedforsecurity=False)
+
+# None results ("nothing found") are cached for ttl // this (at least 1s), so
+# pathological inputs are not recomputed on every call but do not linger either
+NEGATIVE_TTL_DIVISOR = 10
+
+# Texts shorter than this skip the cache by default: hashing and a lookup
+# cost more than recomputing a cheap result
+MIN_CACHED_TEXT_LEN = 16
+
+# Keys scanned and unlinked per Redis round-trip in clear(prefix)
+CLEAR_BATCH_SIZE = 500
+
+# Redis values larger than this (serialized JSON bytes) are zlib-compressed
+# and tagged with a leading b"z"; JSON never starts with "z", so plain
+# entries (including ones written before compression) need no tag
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 3
+
+# Marks an absent entry, so a cached None can be told apart from a miss
+_MISSING = object()
+
 
 class NLPCache:
     """
     Caching layer for NLP results
-    Uses LRU cache with optional Redis backend
+    Uses an in-memory LRU cache, in front of an optional Redis backend
     """
 
-    def __init__(self, use_redis: bool = False, redis_url: str = None, ttl: int = 3600):
+    def __init__(
+        self,
+        use_redis: bool = False,
+        redis_url: str = None,
+        ttl: int = 3600,
+        max_entries: int = 10000,
+        max_connections: int = 64
+    ):
         """
         Initialize cache
 
@@ -26,15 +65,29 @@ class NLPCache:
             use_redis: Use Redis for caching
             redis_url: Redis connection URL
             ttl: Time to live in seconds (default 1 hour)
+            max_entries: In-memory LRU capacity (0 disables the in-memory tier)
+            max_connections: Redis connection pool size (sockets are reused, never more than this)
         """
         self.ttl = ttl
         self.redis_client = None
         self.use_redis = use_redis
 
+        # In-memory LRU: key -> (expiry timestamp, result), most recent last.
+        # Also serves as an L1 in front of Redis, so hot keys skip the round-trip
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._memory_lock = threading.Lock()
+
         if use_redis:
             try:
                 import redis
-                self.redis_client = redis.from_url(redis_url or "redis://localhost:6379/0")
+                pool = redis.ConnectionPool.from_url(
+                    redis_url or "redis://localhost:6379/0",
+                    max_connections=max_connections,
+                    socket_keepalive=True,
+                    health_check_interval=30
+                )
+                self.redis_client = redis.Redis(connection_pool=pool)
                 logger.info("✅ Redis cache initialized")
             except ImportError:
                 logger.warning("⚠️  Redis not available, using in-memory cache")
@@ -60,18 +113,21 @@ class NLPCache:
         Returns:
             Cache key (hash)
         """
-        cache_data = {
-            'text': text,
-            'params': params or {}
-        }
+        # The text is hashed as-is, never copied into a JSON document
+        hash_obj = DEFAULT_HASHER(text.encode())
 
-        # Create hash from JSON string
-        data_str = json.dumps(cache_data, sort_keys=True)
-        hash_obj = hashlib.md5(data_str.encode())
+        # Common case: no params
+        if not params:
+            return f"{prefix}:{hash_obj.hexdigest()}"
 
-        return f"{prefix}:{hash_obj.hexdigest()}"
+        # Params follow a NUL separator (JSON output never contains a raw
+        # NUL, so the split is unambiguous); the 'p:' namespace keeps these
+        # keys apart from text-only keys whatever the text contains
+        hash_obj.update(b"\0")
+        hash_obj.update(orjson.dumps(params, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+        return f"{prefix}:p:{hash_obj.hexdigest()}"
 
-    def get(self, prefix: str, text: str, params: dict = None) -> Optional[Any]:
+    def get(self, prefix: str, text: str, params: dict = None, default: Any = None) -> Optional[Any]:
         """
         Get cached result
 
@@ -79,26 +135,32 @@ class NLPCache:
             prefix: Cache key prefix
             text: Input text
             params: Additional parameters
+            default: Returned when nothing is cached
 
         Returns:
-            Cached result or None
+            Cached result or default
         """
         key = self._generate_key(prefix, text, params)
 
+        cached = self._memory_get(key)
+        if cached is not _MISSING:
+            logger.debug(f"Memory cache hit: {key[:20]}...")
+            return cached
+
         if self.use_redis and self.redis_client:
             try:
                 cached = self.redis_client.get(key)
                 if cached:
                     logger.debug(f"Cache hit: {key[:20]}...")
-                    return json.loads(cached)
+                    result_data = self._decode(cached)
+                    self._memory_set(key, result_data)
+                    return result_data
             except Exception as e:
                 logger.warning(f"Redis get failed: {e}")
 
-        # In-memory cache doesn't support direct key lookup
-        # Would need separate implementation with dict
-        return None
+        return default
 
-    def set(self, prefix: str, text: str, result: Any, params: dict = None):
+    def set(self, prefix: str, text: str, result: Any, params: dict = None, ttl: Optional[int] = None):
         """
         Set cached result
 
@@ -107,26 +169,131 @@ class NLPCache:
             text: Input text
             result: Result to cache
             params: Additional parameters
+            ttl: Time to live in seconds for this entry (default: the cache's ttl)
         """
         key = self._generate_key(prefix, text, params)
+        result_data = self._to_result_data(result)
+        ttl = self.ttl if ttl is None else ttl
+
+        self._memory_set(key, result_data, ttl)
 
         if self.use_redis and self.redis_client:
             try:
-                # Convert result to JSON-serializable format
-                if hasattr(result, 'dict'):
-                    result_data = result.dict()
-                else:
-                    result_data = result
-
                 self.redis_client.setex(
                     key,
-                    self.ttl,
-                    json.dumps(result_data)
+                    ttl,
+                    self._encode(result_data)
                 )
                 logger.debug(f"Cache set: {key[:20]}...")
             except Exception as e:
                 logger.warning(f"Redis set failed: {e}")
 
+    def get_many(self, prefix: str, texts: List[str], params: dict = None) -> List[Optional[Any]]:
+        """
+        Get cached results for several texts
+
+        Keys missing from memory are fetched from Redis in one pipelined
+        round-trip instead of one per text.
+
+        Args:
+            prefix: Cache key prefix
+            texts: Input texts
+            params: Additional parameters (shared by all texts)
+
+        Returns:
+            Cached result or None per text, in input order
+        """
+        keys = [self._generate_key(prefix, text, params) for text in texts]
+        results = [self._memory_get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is _MISSING]
+
+        if missing and self.use_redis and self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for i in missing:
+                    pipe.get(keys[i])
+                for i, cached in zip(missing, pipe.execute()):
+                    if cached:
+                        results[i] = self._decode(cached)
+                        self._memory_set(keys[i], results[i])
+            except Exception as e:
+                logger.warning(f"Redis pipelined get failed: {e}")
+
+        return [None if result is _MISSING else result for result in results]
+
+    def set_many(self, prefix: str, texts: List[str], results: List[Any], params: dict = None):
+        """
+        Set cached results for several texts in one Redis round-trip
+
+        Args:
+            prefix: Cache key prefix
+            texts: Input texts
+            results: Result per text
+            params: Additional parameters (shared by all texts)
+        """
+        entries = [
+            (self._generate_key(prefix, text, params), self._to_result_data(result))
+            for text, result in zip(texts, results)
+        ]
+        for key, result_data in entries:
+            self._memory_set(key, result_data)
+
+        if entries and self.use_redis and self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, result_data in entries:
+                    pipe.setex(key, self.ttl, self._encode(result_data))
+                pipe.execute()
+                logger.debug(f"Cache set: {len(entries)} entries")
+            except Exception as e:
+                logger.warning(f"Redis pipelined set failed: {e}")
+
+    @staticmethod
+    def _encode(result_data: Any) -> bytes:
+        """Serialize a result for Redis, compressing large payloads"""
+        blob = orjson.dumps(result_data)
+        if len(blob) > COMPRESS_MIN_BYTES:
+            return b"z" + zlib.compress(blob, COMPRESS_LEVEL)
+        return blob
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        """Deserialize a Redis value written by _encode"""
+        if blob[:1] == b"z":
+            blob = zlib.decompress(blob[1:])
+        return orjson.loads(blob)
+
+    @staticmethod
+    def _to_result_data(result: Any) -> Any:
+        """Convert result to JSON-serializable format"""
+        if hasattr(result, 'dict'):
+            return result.dict()
+        return result
+
+    def _memory_get(self, key: str) -> Any:
+        """Look up a key in the in-memory LRU (_MISSING if absent or expired)"""
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, result_data = entry
+            if expires_at <= time.monotonic():
+                del self._memory[key]
+                return _MISSING
+            self._memory.move_to_end(key)
+            return result_data
+
+    def _memory_set(self, key: str, result_data: Any, ttl: Optional[int] = None):
+        """Store a key in the in-memory LRU, evicting the least recently used"""
+        if self.max_entries <= 0:
+            return
+        with self._memory_lock:
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._memory[key] = (expires_at, result_data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
     def clear(self, prefix: Optional[str] = None):
         """
         Clear cache
@@ -134,13 +301,26 @@ class NLPCache:
         Args:
             prefix: Clear only keys with this prefix, or all if None
         """
+        with self._memory_lock:
+            if prefix:
+                for key in [key for key in self._memory if key.startswith(f"{prefix}:")]:
+                    del self._memory[key]
+            else:
+                self._memory.clear()
+
         if self.use_redis and self.redis_client:
             try:
                 if prefix:
+                    # SCAN walks the keyspace incrementally instead of blocking
+                    # Redis like KEYS; UNLINK frees memory in the background,
+                    # and each batch goes out as one pipelined round-trip
                     pattern = f"{prefix}:*"
-                    keys = self.redis_client.keys(pattern)
-                    if keys:
-                        self.redis_client.delete(*keys)
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for key in self.redis_client.scan_iter(match=pattern, count=CLEAR_BATCH_SIZE):
+                        pipe.unlink(key)
+                        if len(pipe) >= CLEAR_BATCH_SIZE:
+                            pipe.execute()
+                    pipe.execute()
                     logger.info(f"Cleared cache with prefix: {prefix}")
                 else:
                     self.redis_client.flushdb()
@@ -152,21 +332,38 @@ class NLPCache:
 # Global cache instance
 _cache_instance = None
 
+# Single-flight: cache key -> Future of the computation in progress, so
+# concurrent misses for the same input compute it once
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
 
 def get_cache() -> NLPCache:
-    """Get global cache instance"""
+    """
+    Get global cache instance
+
+    One instance per process, so all callers share its Redis connection pool.
+    """
     global _cache_instance
     if _cache_instance is None:
-        _cache_instance = NLPCache()
+        settings = get_settings()
+        _cache_instance = NLPCache(
+            use_redis=settings.USE_REDIS,
+            redis_url=settings.REDIS_URL,
+            ttl=settings.CACHE_TTL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS
+        )
     return _cache_instance
 
 
-def cached_result(prefix: str):
+def cached_result(prefix: str, min_len: int = MIN_CACHED_TEXT_LEN):
     """
     Decorator for caching function results
 
     Args:
         prefix: Cache key prefix
+        min_len: Texts shorter than this bypass the cache (0 caches everything;
+            use it for functions that are expensive even on short input)
 
     Example:
         @cached_result('lemma')
@@ -174,23 +371,60 @@ def cached_result(prefix: str):
             ...
     """
     def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
         def wrapper(text: str, *args, **kwargs):
+            if len(text) < min_len:
+                return func(text, *args, **kwargs)
+
             cache = get_cache()
 
-            # Try to get from cache
-            params = {**kwargs, 'args': args}
-            cached = cache.get(prefix, text, params)
+            # Key on every bound argument with defaults filled in, so f(text),
+            # f(text, False) and f(text, flag=False) share an entry
+            bound = signature.bind(text, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            del params[next(iter(params))]  # The text is keyed separately
 
-            if cached is not None:
-                return cached
+            # Try to get from cache (a cached None counts as a hit)
+            cached = cache.get(prefix, text, params, default=_MISSING)
 
-            # Compute result
-            result = func(text, *args, **kwargs)
+            if cached is not _MISSING:
+                return cached
 
-            # Cache result
-            cache.set(prefix, text, result, params)
+            # Join a computation of the same input already in progress
+            key = cache._generate_key(prefix, text, params)
+            with _inflight_lock:
+                future = _inflight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = _inflight[key] = Future()
+            if not is_leader:
+                return future.result()
 
-            return result
+            try:
+                # A previous leader may have finished between the miss and now
+                cached = cache.get(prefix, text, params, default=_MISSING)
+                if cached is not _MISSING:
+                    future.set_result(cached)
+                    return cached
+
+                # Compute result
+                result = func(text, *args, **kwargs)
+
+                # Cache result; None results expire sooner
+                ttl = max(1, cache.ttl // NEGATIVE_TTL_DIVISOR) if result is None else None
+                cache.set(prefix, text, result, params, ttl=ttl)
+
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _inflight_lock:
+                    del _inflight[key]
 
         return wrapper
     return decorator
@@ -0,0 +1,112 @@
+"""
+Conditional GET support
+Tags GET responses with an ETag and answers matching If-None-Match with 304
+"""
+import hashlib
+from typing import Iterable, Tuple
+
+
+def _parse_if_none_match(value: str) -> set:
+    """Entity tags listed in an If-None-Match header (weak prefixes dropped)"""
+    tags = set()
+    for tag in value.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag:
+            tags.add(tag)
+    return tags
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware adding ETag and Cache-Control to GET API responses
+
+    The ETag is a hash of the response body, so clients that repeat a request
+    with If-None-Match get an empty 304 instead of the full JSON. Only
+    successful single-message bodies (every Response, not streaming ones)
+    are tagged; everything else passes through untouched.
+    """
+
+    def __init__(self, app, path_prefix: str = "/api/"):
+        """
+        Initialize middleware
+
+        Args:
+            app: ASGI application to wrap
+            path_prefix: Only GET requests under this path are tagged
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = _parse_if_none_match(value.decode("latin-1"))
+                break
+
+        start_message = None
+
+        async def send_with_etag(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                else:
+                    # Hold the headers until the body is known
+                    start_message = message
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            held, start_message = start_message, None
+            if message.get("more_body", False):
+                # Streaming body: cannot hash it up front, send as is
+                await send(held)
+                await send(message)
+                return
+
+            etag = '"' + hashlib.sha1(message.get("body", b""), usedforsecurity=False).hexdigest() + '"'
+            headers = _with_header(held["headers"], b"etag", etag.encode("latin-1"))
+            headers = _with_header(headers, b"cache-control", b"no-cache", replace=False)
+
+            if if_none_match is not None and (etag in if_none_match or "*" in if_none_match):
+                not_modified = [
+                    (name, value) for name, value in headers
+                    if name not in (b"content-length", b"content-type")
+                ]
+                await send({"type": "http.response.start", "status": 304, "headers": not_modified})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**held, "headers": headers})
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
+def _with_header(
+    headers: Iterable[Tuple[bytes, bytes]],
+    name: bytes,
+    value: bytes,
+    replace: bool = True
+) -> list:
+    """Return headers with name set to value (kept as is if present and not replace)"""
+    headers = list(headers)
+    if any(existing == name for existing, _ in headers):
+        if not replace:
+            return headers
+        headers = [(existing, v) for existing, v in headers if existing != name]
+    headers.append((name, value))
+    return headers
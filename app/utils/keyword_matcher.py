@@ -0,0 +1,74 @@
+"""
+Keyword prefix matching
+Finds every word that starts with a known keyword in a single pass over the text
+"""
+import re
+from typing import Dict, List, Tuple
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class PrefixKeywordMatcher:
+    r"""
+    Matches words against a keyword -> severity table
+
+    Equivalent to running one rf'\b{keyword}\w*\b' regex per keyword, but
+    the text is tokenized once and each word is checked with a dict lookup
+    per distinct keyword length, instead of one full scan per keyword.
+    """
+
+    def __init__(self, keywords: Dict[str, float]):
+        """
+        Initialize matcher
+
+        Args:
+            keywords: Lowercase keyword -> severity
+        """
+        self.keywords = dict(keywords)
+        self._lengths = sorted({len(keyword) for keyword in self.keywords})
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> List[Tuple[str, int, float]]:
+        """
+        Find words starting with a keyword
+
+        A word that starts with several keywords (e.g. 'paska' and
+        'paskapuhe') yields one finding per keyword, like the per-keyword
+        regexes did.
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            List of (word, position, severity) in text order
+        """
+        return self.scan(text)[0]
+
+    def scan(self, text: str) -> Tuple[List[Tuple[str, int, float]], int]:
+        """
+        Find keyword words and count all words in the same pass
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            (findings, word_count), where word_count is the number of word-character runs
+        """
+        findings = []
+        keywords = self.keywords
+        lengths = self._lengths
+        word_count = 0
+
+        for match in _WORD_RE.finditer(text):
+            word_count += 1
+            word = match.group()
+            for length in lengths:
+                if length > len(word):
+                    break
+                severity = keywords.get(word[:length])
+                if severity is not None:
+                    findings.append((word, match.start(), severity))
+
+        return findings, word_count
@@ -0,0 +1,22 @@
+"""
+Response helpers
+Serialize engine results straight to JSON bytes
+"""
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelResponse(Response):
+    """
+    JSON response rendered directly from a Pydantic model
+
+    Returning a Response from an endpoint makes FastAPI skip its own
+    response_model pass (re-validation, dict dump and a second JSON encode).
+    The model is serialized once by pydantic-core; response_model on the
+    route still documents the schema in OpenAPI.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")
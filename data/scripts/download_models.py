@@ -9,20 +9,56 @@ This script downloads:
 import os
 import urllib.request
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def download_file(url: str, dest: str):
-    """Download file with progress"""
+# Read/write size while streaming downloads to disk
+CHUNK_SIZE = 1024 * 1024
+
+
+def download_file(url: str, dest: str, show_progress: bool = True):
+    """
+    Download file with progress
+
+    Streams to <dest>.part in 1 MiB chunks and renames it on success, so an
+    interrupted download is never mistaken for a complete file. A failed
+    download removes its .part file.
+
+    Args:
+        url: File to download
+        dest: Path to save it to
+        show_progress: Redraw a percentage line while downloading (turn off
+            when other output runs in parallel, as the redraws interleave)
+    """
     print(f"Downloading from {url}")
     print(f"Saving to {dest}")
 
-    def progress(count, block_size, total_size):
-        percent = int(count * block_size * 100 / total_size)
-        sys.stdout.write(f"\r{percent}% ")
-        sys.stdout.flush()
-
-    urllib.request.urlretrieve(url, dest, progress)
-    print("\n[OK] Download complete")
+    part_path = f"{dest}.part"
+    try:
+        with urllib.request.urlopen(url) as response, open(part_path, 'wb') as f:
+            total_size = int(response.headers.get("Content-Length") or 0)
+            downloaded = 0
+            last_percent = -1
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                downloaded += len(chunk)
+                if not show_progress or not total_size:
+                    continue
+                # Only redraw when the whole percentage changes
+                percent = downloaded * 100 // total_size
+                if percent != last_percent:
+                    last_percent = percent
+                    sys.stdout.write(f"\r{percent}% ")
+                    sys.stdout.flush()
+        os.replace(part_path, dest)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+    if show_progress:
+        print()
+    print(f"[OK] Download complete: {dest}")
 
 
 def setup_directories():
@@ -39,7 +75,7 @@ def setup_directories():
         print(f"[OK] Created directory: {dir_path}")
 
 
-def download_udpipe_model():
+def download_udpipe_model(show_progress: bool = True):
     """Download Finnish UDPipe model"""
     model_url = "https://lindat.mff.cuni.cz/repository/xmlui/bitstream/handle/11234/1-3131/finnish-tdt-ud-2.5-191206.udpipe"
     model_path = "data/models/finnish-tdt-ud-2.5-191206.udpipe"
@@ -50,7 +86,7 @@ def download_udpipe_model():
 
     print("\n[INFO] Downloading UDPipe Finnish model...")
     try:
-        download_file(model_url, model_path)
+        download_file(model_url, model_path, show_progress=show_progress)
     except Exception as e:
         print(f"[ERROR] Failed to download UDPipe model: {e}")
         print("Please download manually from:")
@@ -130,13 +166,17 @@ def main():
     print("\n1. Setting up directories...")
     setup_directories()
 
-    # Download UDPipe model
-    print("\n2. Setting up UDPipe...")
-    download_udpipe_model()
-
-    # Download spaCy model
-    print("\n3. Setting up spaCy...")
-    download_spacy_model()
+    # Download UDPipe and spaCy models concurrently (both wait on the network);
+    # no percentage redraws, which would interleave with pip's output, just a
+    # line per model when it finishes
+    print("\n2. Setting up UDPipe and 3. spaCy (in parallel)...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        downloads = [
+            executor.submit(download_udpipe_model, show_progress=False),
+            executor.submit(download_spacy_model),
+        ]
+        for download in downloads:
+            download.result()
 
     # Voikko instructions
     print("\n4. Voikko setup...")
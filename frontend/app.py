@@ -5,12 +5,17 @@ Interactive UI for testing Finnish NLP features
 import streamlit as st
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
+from urllib3.util.retry import Retry
 
 
 # Configuration
 API_BASE_URL = "http://localhost:8000/api"
 
+# (ETag, body) pairs kept per session for conditional GETs (oldest dropped first)
+ETAG_CACHE_SIZE = 64
+
 # Page configuration
 st.set_page_config(
     page_title="Finnish NLP Toolkit",
@@ -59,28 +64,81 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_session() -> requests.Session:
+    """
+    Shared HTTP session, built once per Streamlit server
+
+    Keep-alive connections are reused across reruns and users instead of
+    opening a new connection per API call.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    ))
+    return session
+
+
+@st.cache_data(ttl=5, show_spinner=False)
 def check_api_health() -> bool:
-    """Check if API is reachable"""
+    """Check if API is reachable (rechecked at most every 5 seconds)"""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=2)
+        response = get_session().get("http://localhost:8000/health", timeout=2)
         return response.status_code == 200
     except:
         return False
 
 
+def _conditional_get(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    GET an API endpoint with If-None-Match and return its JSON body
+
+    The ETag and body of each response are kept in st.session_state, so an
+    unchanged result comes back as an empty 304 and the stored body is reused.
+    """
+    etags = st.session_state.setdefault("api_etags", {})
+    key = (endpoint, tuple(sorted(params.items())))
+    stored = etags.get(key)
+    headers = {"If-None-Match": stored[0]} if stored else {}
+
+    response = get_session().get(
+        f"{API_BASE_URL}/{endpoint}", params=params, headers=headers, timeout=10
+    )
+    if response.status_code == 304 and stored:
+        return stored[1]
+    response.raise_for_status()
+    body = response.json()
+
+    etag = response.headers.get("ETag")
+    if etag:
+        etags.pop(key, None)
+        etags[key] = (etag, body)
+        while len(etags) > ETAG_CACHE_SIZE:
+            del etags[next(iter(etags))]
+    return body
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _get_api_json(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    GET an API endpoint and return its JSON body
+
+    Cached per (endpoint, params), so re-submitting the same input skips the
+    request; once the entry expires, the request is a conditional GET.
+    Errors raise and are therefore never cached.
+    """
+    return _conditional_get(endpoint, params)
+
+
 def call_lemmatize_api(text: str, include_morphology: bool) -> Dict[str, Any]:
     """Call lemmatization API"""
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/lemmatize",
-            params={
-                "text": text,
-                "include_morphology": include_morphology
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
+        return _get_api_json("lemmatize", {
+            "text": text,
+            "include_morphology": include_morphology
+        })
     except Exception as e:
         st.error(f"API Error: {str(e)}")
         return None
@@ -89,16 +147,10 @@ def call_lemmatize_api(text: str, include_morphology: bool) -> Dict[str, Any]:
 def call_complexity_api(text: str, detailed: bool) -> Dict[str, Any]:
     """Call complexity analysis API"""
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/complexity",
-            params={
-                "text": text,
-                "detailed": detailed
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
+        return _get_api_json("complexity", {
+            "text": text,
+            "detailed": detailed
+        })
     except Exception as e:
         st.error(f"API Error: {str(e)}")
         return None
@@ -107,17 +159,11 @@ def call_complexity_api(text: str, detailed: bool) -> Dict[str, Any]:
 def call_profanity_api(text: str, return_flagged_words: bool, threshold: float) -> Dict[str, Any]:
     """Call profanity detection API"""
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/swear-check",
-            params={
-                "text": text,
-                "return_flagged_words": return_flagged_words,
-                "threshold": threshold
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
+        return _get_api_json("swear-check", {
+            "text": text,
+            "return_flagged_words": return_flagged_words,
+            "threshold": threshold
+        })
     except Exception as e:
         st.error(f"API Error: {str(e)}")
         return None